@@ -36,5 +36,5 @@ setup(
         "Programming Language :: Python :: 3",
         "Topic :: Utilities",
     ],
-    python_requires=">=3.7",
+    python_requires=">=3.8",
 )
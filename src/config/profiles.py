@@ -11,10 +11,25 @@ Bietet Funktionen zum Laden, Speichern und Erstellen von Konfigurationsprofilen.
 """
 
 import os
+import sys
 import json
+from copy import deepcopy
+from dataclasses import dataclass, asdict
 from typing import Dict, Any
 
-from .settings import CONFIG_DIR, CONFIG_FILE
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from .settings import CONFIG_DIR, CONFIG_FILE, BUTTON_ACTIONS
+
+# Cache für load_config, Schlüssel (st_mtime_ns, st_size) der Konfigurationsdatei.
+# Spart das wiederholte Parsen, solange sich die Datei nicht geändert hat.
+_CACHE: Dict[Any, Dict[str, Any]] = {}
+
+# Vorformatierte Hex-Darstellung der bekannten Aktionscodes
+_HEX = {code: f"0x{code:02x}" for code in BUTTON_ACTIONS.values()}
 
 def ensure_config_dir() -> bool:
     """
@@ -32,6 +47,146 @@ def ensure_config_dir() -> bool:
             return False
     return True
 
+@dataclass
+class Profile:
+    """
+    In-Memory-Darstellung eines Profils mit festem Slot-Layout.
+    Attributzugriffe sind damit ein einzelner C-Slot-Fetch statt eines
+    Hash-Lookups, und pro Profil entfällt der Dictionary-Overhead.
+    Auf der Platte bleibt das Dictionary-Format das Austauschformat;
+    from_dict/to_dict konvertieren an der Ladegrenze.
+    """
+    __slots__ = ('dpi_stages', 'active_dpi_stage', 'polling_rate',
+                 'liftoff_distance', 'buttons', 'motion_sync',
+                 'ripple_control', 'angle_snap', 'debounce_time',
+                 'power_saving')
+
+    dpi_stages: Dict[int, int]
+    active_dpi_stage: int
+    polling_rate: int
+    liftoff_distance: float
+    buttons: Dict[int, Dict[str, Any]]
+    motion_sync: bool
+    ripple_control: bool
+    angle_snap: bool
+    debounce_time: int
+    power_saving: Dict[str, int]
+
+    @classmethod
+    def from_dict(cls, profile_config: Dict[str, Any]) -> "Profile":
+        """
+        Erstellt ein Profile-Objekt aus einem Profil-Dictionary
+
+        Args:
+            profile_config: Vollständiges Profil-Dictionary (nach _merge_defaults)
+
+        Returns:
+            Profile: Profilobjekt
+        """
+        return cls(**profile_config)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Wandelt das Profil zurück in das Dictionary-Format für save_config
+
+        Returns:
+            Dict[str, Any]: Profil-Dictionary
+        """
+        return asdict(self)
+
+def load_profiles() -> Dict[str, Profile]:
+    """
+    Lädt alle Profile als Profile-Objekte
+
+    Returns:
+        Dict[str, Profile]: Profile nach Profil-ID
+    """
+    config = load_config()
+    return {profile_id: Profile.from_dict(p)
+            for profile_id, p in config["profiles"].items()}
+
+class ActiveProfile:
+    """
+    Leichtgewichtige Sicht auf das aktive Profil einer Konfiguration.
+    Löst die verschachtelten Dictionary-Zugriffe einmal beim Erstellen auf,
+    sodass wiederholte Abfragen nur noch einfache Attributzugriffe sind.
+    Die Attribute referenzieren die Original-Dictionaries, Änderungen an
+    dpi_stages/buttons wirken also direkt auf die Konfiguration.
+    """
+    __slots__ = ('dpi_stages', 'active_dpi_stage', 'buttons', 'polling_rate',
+                 'liftoff_distance', 'motion_sync', 'power_saving',
+                 'requires_special_dongle', '_config', '_id')
+
+    def __init__(self, config: Dict[str, Any]):
+        profile_id = config["active_profile"]
+        profile_config = config["profiles"][profile_id]
+        self._config = config
+        self._id = profile_id
+        self.dpi_stages = profile_config["dpi_stages"]
+        self.active_dpi_stage = profile_config["active_dpi_stage"]
+        self.buttons = profile_config["buttons"]
+        self.polling_rate = profile_config["polling_rate"]
+        self.liftoff_distance = profile_config["liftoff_distance"]
+        self.motion_sync = profile_config["motion_sync"]
+        self.power_saving = profile_config["power_saving"]
+        # Einmal beim Erstellen berechnet; Raten über 1000 Hz erfordern
+        # einen speziellen 4K- oder 8K-Dongle
+        self.requires_special_dongle = self.polling_rate > 1000
+
+def active_profile(config: Dict[str, Any]) -> ActiveProfile:
+    """
+    Erstellt eine ActiveProfile-Sicht auf das aktive Profil
+
+    Args:
+        config: Konfigurationsstruktur
+
+    Returns:
+        ActiveProfile: Sicht auf das aktive Profil
+    """
+    return ActiveProfile(config)
+
+def _normalize_profile_keys(config: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Wandelt die von JSON erzwungenen String-Schlüssel der Stufen- und
+    Tasten-Dictionaries in int-Schlüssel für die Verwendung im Speicher um
+    
+    Args:
+        config: Frisch geparste Konfigurationsstruktur
+        
+    Returns:
+        Dict[str, Any]: Konfiguration mit int-Schlüsseln
+    """
+    for profile_config in config.get("profiles", {}).values():
+        if "dpi_stages" in profile_config:
+            profile_config["dpi_stages"] = {int(k): v for k, v in profile_config["dpi_stages"].items()}
+        if "buttons" in profile_config:
+            profile_config["buttons"] = {int(k): v for k, v in profile_config["buttons"].items()}
+    return config
+
+def _merge_defaults(config: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Ergänzt fehlende Profilschlüssel mit den Standardwerten
+    
+    Ältere Konfigurationsdateien kennen z. B. ripple_control oder
+    debounce_time noch nicht; nach dem Auffüllen können alle Zugriffe
+    direkt indizieren statt überall .get() mit Default zu streuen
+    
+    Args:
+        config: Geparste Konfigurationsstruktur
+        
+    Returns:
+        Dict[str, Any]: Konfiguration mit vollständigen Profilschlüsseln
+    """
+    defaults = create_default_config()["profiles"]["1"]
+    for profile_config in config.get("profiles", {}).values():
+        for key, value in defaults.items():
+            if key not in profile_config:
+                profile_config[key] = deepcopy(value)
+            elif isinstance(value, dict) and key not in ("dpi_stages", "buttons"):
+                for sub_key, sub_value in value.items():
+                    profile_config[key].setdefault(sub_key, sub_value)
+    return config
+
 def save_config(config: Dict[str, Any]) -> bool:
     """
     Speichert die Konfiguration in eine Datei
@@ -46,8 +201,46 @@ def save_config(config: Dict[str, Any]) -> bool:
         return False
     
     try:
-        with open(CONFIG_FILE, 'w') as f:
-            json.dump(config, f, indent=4)
+        # orjson serialisiert deutlich schneller als das Standard-json-Modul;
+        # die 2er-Einrückung ist für eine maschinell geschriebene Datei in Ordnung
+        if orjson is not None:
+            payload = orjson.dumps(config, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        else:
+            payload = json.dumps(config, indent=4).encode()
+
+        # Komplett serialisiert im Speicher, dann ein einziges write() plus
+        # fsync() in eine temporäre Datei und atomares Umbenennen, damit ein
+        # Absturz beim Schreiben keine halbe Konfiguration hinterlässt
+        # PID im Namen, damit parallel laufende Prozesse sich nicht
+        # gegenseitig die temporäre Datei überschreiben
+        tmp_file = f"{CONFIG_FILE}.{os.getpid()}.tmp"
+        fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        try:
+            os.write(fd, payload)
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp_file, CONFIG_FILE)
+
+        # Auch den Verzeichniseintrag persistieren, damit das Umbenennen
+        # einen Stromausfall überlebt
+        try:
+            dir_fd = os.open(CONFIG_DIR, os.O_RDONLY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
+        except OSError:
+            pass
+
+        # Gerade gespeicherte Konfiguration unter dem neuen Dateizustand cachen
+        _CACHE.clear()
+        try:
+            st = os.stat(CONFIG_FILE)
+            _CACHE[(st.st_mtime_ns, st.st_size)] = config
+        except OSError:
+            pass
+
         print(f"Konfiguration gespeichert: {CONFIG_FILE}")
         return True
     except Exception as e:
@@ -66,8 +259,21 @@ def load_config() -> Dict[str, Any]:
         return create_default_config()
     
     try:
-        with open(CONFIG_FILE, 'r') as f:
-            config = json.load(f)
+        # Unveränderte Datei nicht erneut parsen
+        st = os.stat(CONFIG_FILE)
+        cache_key = (st.st_mtime_ns, st.st_size)
+        cached = _CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+
+        with open(CONFIG_FILE, 'rb') as f:
+            buf = f.read()
+        config = orjson.loads(buf) if orjson is not None else json.loads(buf)
+        config = _merge_defaults(_normalize_profile_keys(config))
+
+        _CACHE.clear()
+        _CACHE[cache_key] = config
+
         print(f"Konfiguration geladen: {CONFIG_FILE}")
         return config
     except Exception as e:
@@ -85,22 +291,22 @@ def create_default_config() -> Dict[str, Any]:
         "profiles": {
             "1": {
                 "dpi_stages": {
-                    "1": 800,
-                    "2": 1600,
-                    "3": 3200,
-                    "4": 6400,
-                    "5": 12800,
-                    "6": 25600
+                    1: 800,
+                    2: 1600,
+                    3: 3200,
+                    4: 6400,
+                    5: 12800,
+                    6: 25600
                 },
                 "active_dpi_stage": 2,  # Standardmäßig Stufe 2 (1600 DPI)
                 "polling_rate": 1000,
                 "liftoff_distance": 1.0,
                 "buttons": {
-                    "1": {"action": "Linksklick", "code": 0x01},
-                    "2": {"action": "Rechtsklick", "code": 0x02},
-                    "3": {"action": "Mittlere Taste", "code": 0x03},
-                    "4": {"action": "Zurück", "code": 0x04},
-                    "5": {"action": "Vorwärts", "code": 0x05}
+                    1: {"action": "Linksklick", "code": 0x01},
+                    2: {"action": "Rechtsklick", "code": 0x02},
+                    3: {"action": "Mittlere Taste", "code": 0x03},
+                    4: {"action": "Zurück", "code": 0x04},
+                    5: {"action": "Vorwärts", "code": 0x05}
                 },
                 "motion_sync": True,
                 "ripple_control": False,
@@ -130,37 +336,43 @@ def print_profile_settings(config: Dict[str, Any], profile_id: str = None) -> No
         
     profile_config = config["profiles"][active_profile]
     
-    print("\n=== Profileinstellungen ===")
-    print(f"Profil: {active_profile}" + (" (aktiv)" if active_profile == config["active_profile"] else ""))
+    # Ausgabe erst komplett zusammenbauen und mit einem einzigen write()
+    # ausgeben statt ~20 einzelner print-Aufrufe
+    lines = []
+    lines.append("\n=== Profileinstellungen ===")
+    lines.append(f"Profil: {active_profile}" + (" (aktiv)" if active_profile == config["active_profile"] else ""))
     
     # DPI-Einstellungen
-    print("\nDPI-Stufen:")
+    lines.append("\nDPI-Stufen:")
     for stage, dpi in profile_config["dpi_stages"].items():
-        marker = " *" if int(stage) == profile_config["active_dpi_stage"] else ""
-        print(f"  Stufe {stage}: {dpi} DPI{marker}")
+        marker = " *" if stage == profile_config["active_dpi_stage"] else ""
+        lines.append(f"  Stufe {stage}: {dpi} DPI{marker}")
     
     # Polling-Rate
-    print(f"\nPolling-Rate: {profile_config['polling_rate']} Hz")
+    lines.append(f"\nPolling-Rate: {profile_config['polling_rate']} Hz")
     
     # Lift-Off-Distanz
-    print(f"Lift-Off-Distanz: {profile_config['liftoff_distance']} mm")
+    lines.append(f"Lift-Off-Distanz: {profile_config['liftoff_distance']} mm")
     
     # Tastenbelegung
-    print("\nTastenbelegung:")
-    for button, config in profile_config["buttons"].items():
-        print(f"  Taste {button}: {config['action']} (Code: 0x{config['code']:02x})")
+    lines.append("\nTastenbelegung:")
+    for button, btn_cfg in profile_config["buttons"].items():
+        code = btn_cfg['code']
+        lines.append(f"  Taste {button}: {btn_cfg['action']} (Code: {_HEX.get(code) or f'0x{code:02x}'})")
     
     # Weitere Einstellungen
-    print("\nWeitere Einstellungen:")
-    print(f"  Motion Sync: {'Ein' if profile_config['motion_sync'] else 'Aus'}")
-    print(f"  Ripple Control: {'Ein' if profile_config.get('ripple_control', False) else 'Aus'}")
-    print(f"  Angle Snap: {'Ein' if profile_config.get('angle_snap', False) else 'Aus'}")
-    print(f"  Debounce-Zeit: {profile_config.get('debounce_time', 3)} ms")
+    lines.append("\nWeitere Einstellungen:")
+    lines.append(f"  Motion Sync: {'Ein' if profile_config['motion_sync'] else 'Aus'}")
+    lines.append(f"  Ripple Control: {'Ein' if profile_config['ripple_control'] else 'Aus'}")
+    lines.append(f"  Angle Snap: {'Ein' if profile_config['angle_snap'] else 'Aus'}")
+    lines.append(f"  Debounce-Zeit: {profile_config['debounce_time']} ms")
     
     # Energiesparoptionen
-    print("\nEnergiesparoptionen:")
-    print(f"  Idle-Zeit: {profile_config['power_saving']['idle_time']} Sekunden")
-    print(f"  Low-Battery-Schwellwert: {profile_config['power_saving']['low_battery_threshold']}%")
+    lines.append("\nEnergiesparoptionen:")
+    lines.append(f"  Idle-Zeit: {profile_config['power_saving']['idle_time']} Sekunden")
+    lines.append(f"  Low-Battery-Schwellwert: {profile_config['power_saving']['low_battery_threshold']}%")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
 
 def copy_profile(config: Dict[str, Any], source_id: str, target_id: str) -> Dict[str, Any]:
     """
@@ -178,8 +390,9 @@ def copy_profile(config: Dict[str, Any], source_id: str, target_id: str) -> Dict
         print(f"Fehler: Quellprofil {source_id} nicht gefunden.")
         return config
         
-    # Profil kopieren
-    config["profiles"][target_id] = config["profiles"][source_id].copy()
+    # Profil kopieren; deepcopy, damit Ziel und Quelle keine
+    # verschachtelten Dictionaries (dpi_stages, buttons) teilen
+    config["profiles"][target_id] = deepcopy(config["profiles"][source_id])
     print(f"Profil {source_id} wurde nach Profil {target_id} kopiert.")
     
     return config
@@ -201,8 +414,9 @@ def reset_profile(config: Dict[str, Any], profile_id: str) -> Dict[str, Any]:
         print(f"Fehler: Profil {profile_id} nicht gefunden.")
         return config
         
-    # Profil zurücksetzen
-    config["profiles"][profile_id] = default_config["profiles"]["1"].copy()
+    # Profil zurücksetzen; create_default_config liefert bereits frische
+    # verschachtelte Dictionaries, die Kopie braucht also keine Tiefe
+    config["profiles"][profile_id] = default_config["profiles"]["1"]
     print(f"Profil {profile_id} wurde auf Standardwerte zurückgesetzt.")
     
     return config
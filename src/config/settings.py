@@ -25,9 +25,27 @@ MAX_POLLING_RATE = 8000  # Mit speziellem Dongle
 
 # Konfigurationswerte
 DPI_RANGE = range(50, MAX_DPI + 50, 10)  # 50 bis 32000 in 10er-Schritten
-DEFAULT_DPI_STAGES = [800, 1600, 3200, 6400, 12800, 25600]  # Standardwerte für 6 Stufen
-POLLING_RATES = [125, 250, 500, 1000, 2000, 4000, 8000]  # Standard + 8K mit speziellem Dongle
-LIFT_OFF_DISTANCE = [0.7, 1.0, 2.0]  # in mm
+
+def is_valid_dpi(dpi: int) -> bool:
+    """
+    Prüft rein arithmetisch, ob ein DPI-Wert gültig ist
+
+    Args:
+        dpi: DPI-Wert
+
+    Returns:
+        bool: True, wenn der Wert im Bereich 50-32000 in 10er-Schritten liegt
+    """
+    return 50 <= dpi <= MAX_DPI and dpi % 10 == 0
+
+DEFAULT_DPI_STAGES = (800, 1600, 3200, 6400, 12800, 25600)  # Standardwerte für 6 Stufen
+POLLING_RATES = (125, 250, 500, 1000, 2000, 4000, 8000)  # Standard + 8K mit speziellem Dongle
+LIFT_OFF_DISTANCE = (0.7, 1.0, 2.0)  # in mm
+
+# Frozensets für O(1)-Mitgliedschaftstests; die Tupel oben bleiben für
+# geordnete Ausgaben und argparse-choices erhalten
+POLLING_RATES_SET = frozenset(POLLING_RATES)
+LIFT_OFF_DISTANCE_SET = frozenset(LIFT_OFF_DISTANCE)
 
 # Tastenkonfiguration
 BUTTON_ACTIONS = {
@@ -49,6 +67,18 @@ BUTTON_ACTIONS = {
     "Deaktiviert": 0x00
 }
 
+# Vorberechnete Hilfsstrukturen für schnelle Lookups
+BUTTON_ACTIONS_BY_CODE = {code: name for name, code in BUTTON_ACTIONS.items()}
+BUTTON_ACTION_NAMES = frozenset(BUTTON_ACTIONS)
+
+# Protokollcodes für Polling-Rate und Lift-Off-Distanz
+POLLING_CODE = {125: 0, 250: 1, 500: 2, 1000: 3, 2000: 4, 4000: 5, 8000: 6}
+LIFTOFF_CODE = {0.7: 0, 1.0: 1, 2.0: 2}
+
+# Sortierte Tupel für die Suche nach dem nächstgelegenen gültigen Wert
+POLLING_RATES_SORTED = tuple(sorted(POLLING_RATES))
+LIFT_OFF_DISTANCE_SORTED = tuple(sorted(LIFT_OFF_DISTANCE))
+
 # Standardpfad für Konfigurationsdateien
 CONFIG_DIR = os.path.expanduser("~/.config/pulsar")
 CONFIG_FILE = os.path.join(CONFIG_DIR, "pulsar_x2_config.json")
@@ -58,12 +88,14 @@ CONFIG_FILE = os.path.join(CONFIG_DIR, "pulsar_x2_config.json")
 # Die tatsächlichen Befehle müssen durch Reverse Engineering ermittelt werden
 
 # Hypothetisches Befehlsformat: [Befehlstyp, Parameter1, Parameter2, ...]
-CMD_GET_INFO =          [0x10, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00]
-CMD_GET_SETTINGS =      [0x12, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00]
-CMD_SET_DPI =           [0x20, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00]  # + Stage, DPI-Hi, DPI-Lo
-CMD_SET_POLLING =       [0x30, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00]  # + Rate
-CMD_SET_LIFTOFF =       [0x40, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00]  # + Distanz
-CMD_SET_BUTTON =        [0x50, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00]  # + Button, Aktion
-CMD_SET_MOTION_SYNC =   [0x60, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00]  # + Status
-CMD_SET_POWER =         [0x70, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00]  # + Zeit
-CMD_SAVE_PROFILE =      [0xF0, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00]  # + Profil
+# Unveränderliche bytes-Vorlagen; Befehle werden per bytearray(CMD_X) aufgebaut
+CMD_GET_INFO =          b'\x10\x00\x00\x00\x00\x00\x00\x00'
+CMD_GET_SETTINGS =      b'\x12\x00\x00\x00\x00\x00\x00\x00'
+CMD_SET_DPI =           b'\x20\x00\x00\x00\x00\x00\x00\x00'  # + Stage, DPI-Hi, DPI-Lo
+CMD_SET_DPI_BATCH =     b'\x21' + b'\x00' * 12                # + je Stufe 1-6: DPI-Hi, DPI-Lo
+CMD_SET_POLLING =       b'\x30\x00\x00\x00\x00\x00\x00\x00'  # + Rate
+CMD_SET_LIFTOFF =       b'\x40\x00\x00\x00\x00\x00\x00\x00'  # + Distanz
+CMD_SET_BUTTON =        b'\x50\x00\x00\x00\x00\x00\x00\x00'  # + Button, Aktion
+CMD_SET_MOTION_SYNC =   b'\x60\x00\x00\x00\x00\x00\x00\x00'  # + Status
+CMD_SET_POWER =         b'\x70\x00\x00\x00\x00\x00\x00\x00'  # + Zeit
+CMD_SAVE_PROFILE =      b'\xf0\x00\x00\x00\x00\x00\x00\x00'  # + Profil
@@ -10,10 +10,12 @@ Button-Controller für Pulsar X2.
 Spezialisierte Funktionen für die Verwaltung der Tastenbelegung.
 """
 
-from typing import Dict, Any, List, Optional
-from src.config.settings import CMD_SET_BUTTON, BUTTON_ACTIONS
+from typing import Dict, Any, Optional
+from src.config.settings import (CMD_SET_BUTTON, BUTTON_ACTIONS,
+                                 BUTTON_ACTIONS_BY_CODE, BUTTON_ACTION_NAMES)
+from src.config.profiles import ActiveProfile
 
-def create_button_command(button: int, action_name: str) -> Optional[List[int]]:
+def create_button_command(button: int, action_name: str) -> Optional[bytearray]:
     """
     Erstellt einen Befehl zum Setzen der Tastenbelegung
     
@@ -22,20 +24,20 @@ def create_button_command(button: int, action_name: str) -> Optional[List[int]]:
         action_name: Name der Aktion aus BUTTON_ACTIONS
         
     Returns:
-        Optional[List[int]]: Befehlsbytes oder None bei Fehler
+        Optional[bytearray]: Befehlsbytes oder None bei Fehler
     """
     # Gültigkeit der Taste prüfen
     if not 1 <= button <= 5:
         return None
     
     # Gültigkeit der Aktion prüfen
-    if action_name not in BUTTON_ACTIONS:
+    if action_name not in BUTTON_ACTION_NAMES:
         return None
     
     action_code = BUTTON_ACTIONS[action_name]
     
     # Befehl zusammenstellen
-    command = CMD_SET_BUTTON.copy()
+    command = bytearray(CMD_SET_BUTTON)
     command[1] = button
     command[2] = action_code
     
@@ -46,7 +48,7 @@ def get_button_config(config: Dict[str, Any], button: int) -> Optional[Dict[str,
     Ermittelt die aktuelle Konfiguration einer Taste
     
     Args:
-        config: Konfigurationsstruktur
+        config: Konfigurationsstruktur oder ActiveProfile-Sicht
         button: Tastennummer (1-5)
         
     Returns:
@@ -55,10 +57,13 @@ def get_button_config(config: Dict[str, Any], button: int) -> Optional[Dict[str,
     if not 1 <= button <= 5:
         return None
     
+    if isinstance(config, ActiveProfile):
+        return config.buttons.get(button)
+
     active_profile = config["active_profile"]
     profile_config = config["profiles"][active_profile]
     
-    return profile_config["buttons"].get(str(button))
+    return profile_config["buttons"].get(button)
 
 def get_action_name(action_code: int) -> Optional[str]:
     """
@@ -70,8 +75,4 @@ def get_action_name(action_code: int) -> Optional[str]:
     Returns:
         Optional[str]: Aktionsname oder None, wenn nicht gefunden
     """
-    for name, code in BUTTON_ACTIONS.items():
-        if code == action_code:
-            return name
-    
-    return None
+    return BUTTON_ACTIONS_BY_CODE.get(action_code)
@@ -10,10 +10,12 @@ DPI-Controller für Pulsar X2.
 Spezialisierte Funktionen für die Verwaltung der DPI-Einstellungen.
 """
 
-from typing import Dict, Any, List, Optional
+import struct
+from typing import Dict, Any, Optional
 from src.config.settings import CMD_SET_DPI, MAX_DPI
+from src.config.profiles import ActiveProfile
 
-def create_dpi_command(dpi: int, stage: int = 1) -> List[int]:
+def create_dpi_command(dpi: int, stage: int = 1) -> bytearray:
     """
     Erstellt einen Befehl zum Setzen der DPI
     
@@ -22,17 +24,16 @@ def create_dpi_command(dpi: int, stage: int = 1) -> List[int]:
         stage: DPI-Stufe (1-6)
         
     Returns:
-        List[int]: Befehlsbytes
+        bytearray: Befehlsbytes
     """
-    # DPI-Wert auf gültigen Bereich beschränken und auf 10er-Schritte runden
-    dpi = max(50, min(MAX_DPI, dpi))
-    dpi = round(dpi / 10) * 10
-    
-    # Befehl zusammenstellen
-    command = CMD_SET_DPI.copy()
-    command[1] = stage
-    command[2] = (dpi >> 8) & 0xFF  # High-Byte
-    command[3] = dpi & 0xFF         # Low-Byte
+    # DPI-Wert auf 10er-Schritte runden und auf den gültigen Bereich
+    # beschränken — reine Ganzzahlarithmetik ohne Float-Division
+    dpi = (dpi + 5) // 10 * 10
+    dpi = 50 if dpi < 50 else MAX_DPI if dpi > MAX_DPI else dpi
+
+    # Befehl zusammenstellen: Stage als Byte, DPI als 16-Bit-Wert (Big-Endian)
+    command = bytearray(CMD_SET_DPI)
+    struct.pack_into('>BH', command, 1, stage, dpi)
     
     return command
 
@@ -41,19 +42,24 @@ def get_dpi_from_config(config: Dict[str, Any], stage: Optional[int] = None) ->
     Ermittelt den aktuellen DPI-Wert aus der Konfiguration
     
     Args:
-        config: Konfigurationsstruktur
+        config: Konfigurationsstruktur oder ActiveProfile-Sicht
         stage: Optional, DPI-Stufe (1-6). Wenn None, wird die aktive Stufe verwendet
         
     Returns:
         int: DPI-Wert
     """
+    if isinstance(config, ActiveProfile):
+        if stage is None:
+            stage = config.active_dpi_stage
+        return config.dpi_stages[stage]
+
     active_profile = config["active_profile"]
     profile_config = config["profiles"][active_profile]
     
     if stage is None:
         stage = profile_config["active_dpi_stage"]
     
-    return profile_config["dpi_stages"][str(stage)]
+    return profile_config["dpi_stages"][stage]
 
 def set_active_dpi_stage(config: Dict[str, Any], stage: int) -> Dict[str, Any]:
     """
@@ -88,9 +94,8 @@ def cycle_dpi_stage(config: Dict[str, Any]) -> Dict[str, Any]:
     profile_config = config["profiles"][active_profile]
     current_stage = profile_config["active_dpi_stage"]
     
-    # Anzahl der konfigurierten Stufen ermitteln
-    stages = sorted([int(s) for s in profile_config["dpi_stages"].keys()])
-    max_stage = max(stages)
+    # Höchste konfigurierte Stufe ermitteln; ein Sortieren ist dafür unnötig
+    max_stage = max(profile_config["dpi_stages"])
     
     # Zur nächsten Stufe wechseln oder zum Anfang zurückkehren
     next_stage = current_stage + 1 if current_stage < max_stage else 1
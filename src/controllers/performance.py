@@ -10,10 +10,14 @@ Performance-Controller für Pulsar X2.
 Spezialisierte Funktionen für die Verwaltung der Performance-Optionen.
 """
 
-from typing import Dict, Any, List
-from src.config.settings import CMD_SET_MOTION_SYNC, CMD_SET_LIFTOFF, LIFT_OFF_DISTANCE
+from bisect import bisect_left
+from typing import Dict, Any
+from src.config.settings import (CMD_SET_MOTION_SYNC, CMD_SET_LIFTOFF,
+                                 LIFT_OFF_DISTANCE, LIFTOFF_CODE,
+                                 LIFT_OFF_DISTANCE_SORTED)
+from src.config.profiles import ActiveProfile
 
-def create_motion_sync_command(enabled: bool) -> List[int]:
+def create_motion_sync_command(enabled: bool) -> bytearray:
     """
     Erstellt einen Befehl zum Setzen von Motion Sync
     
@@ -21,14 +25,14 @@ def create_motion_sync_command(enabled: bool) -> List[int]:
         enabled: Ob Motion Sync aktiviert werden soll
         
     Returns:
-        List[int]: Befehlsbytes
+        bytearray: Befehlsbytes
     """
-    command = CMD_SET_MOTION_SYNC.copy()
+    command = bytearray(CMD_SET_MOTION_SYNC)
     command[1] = 1 if enabled else 0
     
     return command
 
-def create_liftoff_command(distance: float) -> List[int]:
+def create_liftoff_command(distance: float) -> bytearray:
     """
     Erstellt einen Befehl zum Setzen der Lift-Off-Distanz
     
@@ -36,19 +40,24 @@ def create_liftoff_command(distance: float) -> List[int]:
         distance: Distanz in mm (0.7, 1.0, 2.0)
         
     Returns:
-        List[int]: Befehlsbytes
+        bytearray: Befehlsbytes
     """
-    # Gültigkeit der Distanz prüfen
-    if distance not in LIFT_OFF_DISTANCE:
-        closest_dist = min(LIFT_OFF_DISTANCE, key=lambda x: abs(x - distance))
-        distance = closest_dist
-    
-    # Wert für das Protokoll ermitteln
-    dist_values = {0.7: 0, 1.0: 1, 2.0: 2}
-    dist_value = dist_values[distance]
+    # Wert für das Protokoll ermitteln; bei ungültiger Distanz den
+    # nächstgelegenen gültigen Wert per Binärsuche bestimmen
+    dist_value = LIFTOFF_CODE.get(distance)
+    if dist_value is None:
+        pos = bisect_left(LIFT_OFF_DISTANCE_SORTED, distance)
+        if pos == 0:
+            distance = LIFT_OFF_DISTANCE_SORTED[0]
+        elif pos == len(LIFT_OFF_DISTANCE_SORTED):
+            distance = LIFT_OFF_DISTANCE_SORTED[-1]
+        else:
+            lower, upper = LIFT_OFF_DISTANCE_SORTED[pos - 1], LIFT_OFF_DISTANCE_SORTED[pos]
+            distance = lower if distance - lower <= upper - distance else upper
+        dist_value = LIFTOFF_CODE[distance]
     
     # Befehl zusammenstellen
-    command = CMD_SET_LIFTOFF.copy()
+    command = bytearray(CMD_SET_LIFTOFF)
     command[1] = dist_value
     
     return command
@@ -58,18 +67,21 @@ def get_performance_settings(config: Dict[str, Any]) -> Dict[str, Any]:
     Ermittelt die aktuellen Performance-Einstellungen aus der Konfiguration
     
     Args:
-        config: Konfigurationsstruktur
+        config: Konfigurationsstruktur oder ActiveProfile-Sicht
         
     Returns:
         Dict[str, Any]: Performance-Einstellungen
     """
+    if isinstance(config, ActiveProfile):
+        config = config._config
+
     active_profile = config["active_profile"]
     profile_config = config["profiles"][active_profile]
     
     return {
         "motion_sync": profile_config["motion_sync"],
-        "ripple_control": profile_config.get("ripple_control", False),
-        "angle_snap": profile_config.get("angle_snap", False),
-        "debounce_time": profile_config.get("debounce_time", 3),
+        "ripple_control": profile_config["ripple_control"],
+        "angle_snap": profile_config["angle_snap"],
+        "debounce_time": profile_config["debounce_time"],
         "liftoff_distance": profile_config["liftoff_distance"]
     }
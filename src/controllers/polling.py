@@ -10,10 +10,13 @@ Polling-Rate-Controller für Pulsar X2.
 Spezialisierte Funktionen für die Verwaltung der Polling-Rate.
 """
 
-from typing import Dict, Any, List
-from src.config.settings import CMD_SET_POLLING, POLLING_RATES
+from bisect import bisect_left
+from typing import Dict, Any
+from src.config.settings import (CMD_SET_POLLING, POLLING_RATES,
+                                 POLLING_CODE, POLLING_RATES_SORTED)
+from src.config.profiles import ActiveProfile
 
-def create_polling_rate_command(rate: int) -> List[int]:
+def create_polling_rate_command(rate: int) -> bytearray:
     """
     Erstellt einen Befehl zum Setzen der Polling-Rate
     
@@ -21,27 +24,24 @@ def create_polling_rate_command(rate: int) -> List[int]:
         rate: Rate in Hz (125, 250, 500, 1000, 2000, 4000, 8000)
         
     Returns:
-        List[int]: Befehlsbytes
+        bytearray: Befehlsbytes
     """
-    # Gültigkeit der Rate prüfen
-    if rate not in POLLING_RATES:
-        closest_rate = min(POLLING_RATES, key=lambda x: abs(x - rate))
-        rate = closest_rate
-    
-    # Wert für das Protokoll ermitteln
-    rate_values = {
-        125: 0,
-        250: 1,
-        500: 2,
-        1000: 3,
-        2000: 4,
-        4000: 5,
-        8000: 6
-    }
-    rate_value = rate_values[rate]
+    # Wert für das Protokoll ermitteln; bei ungültiger Rate den
+    # nächstgelegenen gültigen Wert per Binärsuche bestimmen
+    rate_value = POLLING_CODE.get(rate)
+    if rate_value is None:
+        pos = bisect_left(POLLING_RATES_SORTED, rate)
+        if pos == 0:
+            rate = POLLING_RATES_SORTED[0]
+        elif pos == len(POLLING_RATES_SORTED):
+            rate = POLLING_RATES_SORTED[-1]
+        else:
+            lower, upper = POLLING_RATES_SORTED[pos - 1], POLLING_RATES_SORTED[pos]
+            rate = lower if rate - lower <= upper - rate else upper
+        rate_value = POLLING_CODE[rate]
     
     # Befehl zusammenstellen
-    command = CMD_SET_POLLING.copy()
+    command = bytearray(CMD_SET_POLLING)
     command[1] = rate_value
     
     return command
@@ -51,11 +51,14 @@ def get_polling_rate_from_config(config: Dict[str, Any]) -> int:
     Ermittelt die aktuelle Polling-Rate aus der Konfiguration
     
     Args:
-        config: Konfigurationsstruktur
+        config: Konfigurationsstruktur oder ActiveProfile-Sicht
         
     Returns:
         int: Polling-Rate in Hz
     """
+    if isinstance(config, ActiveProfile):
+        return config.polling_rate
+
     active_profile = config["active_profile"]
     profile_config = config["profiles"][active_profile]
     
@@ -64,11 +67,13 @@ def get_polling_rate_from_config(config: Dict[str, Any]) -> int:
 def requires_special_dongle(rate: int) -> bool:
     """
     Prüft, ob eine Polling-Rate einen speziellen 4K- oder 8K-Dongle erfordert
-    
+
     Args:
-        rate: Polling-Rate in Hz
-        
+        rate: Polling-Rate in Hz oder ActiveProfile-Sicht
+
     Returns:
         bool: True, wenn ein spezieller Dongle erforderlich ist
     """
+    if isinstance(rate, ActiveProfile):
+        return rate.requires_special_dongle
     return rate > 1000
@@ -10,10 +10,12 @@ Energiespar-Controller für Pulsar X2.
 Spezialisierte Funktionen für die Verwaltung der Energiesparoptionen.
 """
 
-from typing import Dict, Any, List, Optional
+import struct
+from typing import Dict, Any, Optional
 from src.config.settings import CMD_SET_POWER
+from src.config.profiles import ActiveProfile
 
-def create_power_saving_command(idle_time: int, low_battery_threshold: Optional[int] = None) -> List[int]:
+def create_power_saving_command(idle_time: int, low_battery_threshold: Optional[int] = None) -> bytearray:
     """
     Erstellt einen Befehl zum Setzen der Energiesparoptionen
     
@@ -22,16 +24,15 @@ def create_power_saving_command(idle_time: int, low_battery_threshold: Optional[
         low_battery_threshold: Optionaler Prozentwert für den Low-Battery-Modus (5-20)
         
     Returns:
-        List[int]: Befehlsbytes
+        bytearray: Befehlsbytes
     """
     # Gültigkeit der Werte prüfen
     idle_time = max(30, min(900, idle_time))
     
-    # Befehl zusammenstellen
-    command = CMD_SET_POWER.copy()
-    command[1] = idle_time & 0xFF         # Low-Byte
-    command[2] = (idle_time >> 8) & 0xFF  # High-Byte
-    
+    # Befehl zusammenstellen; Idle-Zeit als 16-Bit-Wert (Little-Endian)
+    command = bytearray(CMD_SET_POWER)
+    struct.pack_into('<H', command, 1, idle_time)
+
     if low_battery_threshold is not None:
         low_battery_threshold = max(5, min(20, low_battery_threshold))
         command[3] = low_battery_threshold
@@ -43,13 +44,16 @@ def get_power_settings(config: Dict[str, Any]) -> Dict[str, int]:
     Ermittelt die aktuellen Energiespareinstellungen aus der Konfiguration
     
     Args:
-        config: Konfigurationsstruktur
+        config: Konfigurationsstruktur oder ActiveProfile-Sicht
         
     Returns:
         Dict[str, int]: Energiespareinstellungen
     """
-    active_profile = config["active_profile"]
-    power_config = config["profiles"][active_profile]["power_saving"]
+    if isinstance(config, ActiveProfile):
+        power_config = config.power_saving
+    else:
+        active_profile = config["active_profile"]
+        power_config = config["profiles"][active_profile]["power_saving"]
     
     return {
         "idle_time": power_config["idle_time"],
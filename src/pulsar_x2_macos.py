@@ -15,16 +15,17 @@ import argparse
 import signal
 from typing import Dict, Any, Optional
 
-from .usb.usb_protocol import PulsarMouse
-from .config.settings import (DPI_RANGE, POLLING_RATES, LIFT_OFF_DISTANCE, 
+from .config.settings import (DPI_RANGE, POLLING_RATES, LIFT_OFF_DISTANCE,
                               MAX_DPI, MAX_POLLING_RATE)
 from .config.profiles import load_config, save_config
-from .ui.interactive import interactive_cli
 
-def parse_arguments():
-    """Kommandozeilenargumente verarbeiten"""
+# Einmal gebauter Parser; argparse-Parser sind für parse_args wiederverwendbar
+_PARSER: Optional[argparse.ArgumentParser] = None
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Erstellt den Argument-Parser"""
     parser = argparse.ArgumentParser(description='Pulsar X2 macOS-CLI')
-    
+
     parser.add_argument('--debug', action='store_true', 
                         help='Debug-Modus (keine tatsächliche USB-Kommunikation)')
     parser.add_argument('--dpi', type=int, 
@@ -40,15 +41,22 @@ def parse_arguments():
     parser.add_argument('--idle-time', type=int, 
                         help='Idle-Zeit für Energiesparmodus setzen (30-900 Sekunden)')
     parser.add_argument('--battery-threshold', type=int, 
-                        help='Low-Battery-Schwellwert setzen (5-20%)')
+                        help='Low-Battery-Schwellwert setzen (5-20%%)')
     parser.add_argument('--profile', type=int, choices=[1, 2, 3, 4], 
                         help='Aktives Profil setzen')
     parser.add_argument('--info', action='store_true', 
                         help='Geräteinformationen anzeigen')
     parser.add_argument('--settings', action='store_true', 
                         help='Aktuelle Einstellungen anzeigen')
-    
-    return parser.parse_args()
+
+    return parser
+
+def parse_arguments():
+    """Kommandozeilenargumente verarbeiten"""
+    global _PARSER
+    if _PARSER is None:
+        _PARSER = _build_parser()
+    return _PARSER.parse_args()
 
 def main():
     """Hauptfunktion des Programms"""
@@ -61,7 +69,12 @@ def main():
             sys.exit(0)
         
         signal.signal(signal.SIGINT, signal_handler)
-        
+
+        # Import erst nach dem Argument-Parsing: pyusb lädt das
+        # libusb-Backend per ctypes, was den Start von --help und
+        # fehlerhaften Aufrufen unnötig verlangsamen würde
+        from .usb.usb_protocol import PulsarMouse
+
         # Mausobjekt initialisieren
         mouse = PulsarMouse(debug_mode=args.debug)
         
@@ -93,6 +106,7 @@ def main():
         
         # Wenn keine Argumente angegeben wurden oder nur --debug, interaktiven Modus starten
         if all(arg is None or (isinstance(arg, bool) and arg is False) for arg in vars(args).values()) or (args.debug and len(sys.argv) == 2):
+            from .ui.interactive import interactive_cli
             interactive_cli(mouse)
             
     except KeyboardInterrupt:
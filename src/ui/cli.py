@@ -12,8 +12,49 @@ Vereinfacht die Ausgabe und Formatierung von Informationen in der Konsole.
 
 import os
 import sys
+import time
+import signal
 from typing import Dict, Any, List, Optional
 
+# Cache für die Terminalbreite: os.get_terminal_size() ist ein ioctl-Syscall,
+# der in menülastigen Abläufen dutzendfach pro Bildschirm anfiele
+_cached_width: Optional[int] = None
+_cached_at: float = 0.0
+
+def _invalidate_width(*_args):
+    """Setzt den Breiten-Cache zurück (z. B. bei Fenstergrößenänderung)"""
+    global _cached_width
+    _cached_width = None
+
+# Bei einer Größenänderung des Terminals den Cache invalidieren
+if hasattr(signal, 'SIGWINCH'):
+    try:
+        signal.signal(signal.SIGWINCH, _invalidate_width)
+    except ValueError:
+        # signal.signal funktioniert nur im Hauptthread
+        pass
+
+def get_cached_width(ttl: float = 0.5) -> int:
+    """
+    Ermittelt die auf 80 Zeichen begrenzte Terminalbreite mit Cache
+
+    Args:
+        ttl: Maximales Alter des Cache-Eintrags in Sekunden
+
+    Returns:
+        int: Terminalbreite, höchstens 80 Zeichen
+    """
+    global _cached_width, _cached_at
+    now = time.monotonic()
+    if _cached_width is None or now - _cached_at > ttl:
+        try:
+            _cached_width = min(os.get_terminal_size().columns, 80)
+        except OSError:
+            # stdout ist kein Terminal (Pipe/Datei)
+            _cached_width = 80
+        _cached_at = now
+    return _cached_width
+
 def clear_screen():
     """Bildschirm löschen"""
     os.system('cls' if os.name == 'nt' else 'clear')
@@ -25,7 +66,7 @@ def print_header(title: str):
     Args:
         title: Titel der Überschrift
     """
-    width = min(os.get_terminal_size().columns, 80)
+    width = get_cached_width()
     print("\n" + "=" * width)
     print(title.center(width))
     print("=" * width)
@@ -37,7 +78,7 @@ def print_subheader(title: str):
     Args:
         title: Titel der Unterüberschrift
     """
-    width = min(os.get_terminal_size().columns, 80)
+    width = get_cached_width()
     print("\n" + "-" * width)
     print(title)
     print("-" * width)
@@ -62,12 +103,12 @@ def print_menu(options: List[str], prompt: str = "Wählen Sie eine Option") -> s
     Returns:
         str: Ausgewählte Option
     """
-    for i, option in enumerate(options, 1):
-        print(f"{i}. {option}")
-    
+    lines = [f"{i}. {option}" for i, option in enumerate(options, 1)]
+
     if "0. Zurück" not in options and "0. Beenden" not in options:
-        print("0. Zurück")
-    
+        lines.append("0. Zurück")
+
+    sys.stdout.write("\n".join(lines) + "\n")
     return input(f"\n{prompt} (0-{len(options)}): ")
 
 def print_value_list(items: Dict[str, Any], title: Optional[str] = None):
@@ -78,14 +119,12 @@ def print_value_list(items: Dict[str, Any], title: Optional[str] = None):
         items: Dictionary mit Beschreibungen als Schlüssel und Werten
         title: Optionaler Titel
     """
-    if title:
-        print(f"\n{title}:")
-    
     # Längste Beschreibung finden
     max_key_len = max(len(str(key)) for key in items.keys())
-    
-    for key, value in items.items():
-        print(f"  {str(key):<{max_key_len}} : {value}")
+
+    lines = [f"\n{title}:"] if title else []
+    lines.extend(f"  {str(key):<{max_key_len}} : {value}" for key, value in items.items())
+    sys.stdout.write("\n".join(lines) + "\n")
 
 def print_table(headers: List[str], rows: List[List[Any]]):
     """
@@ -99,21 +138,16 @@ def print_table(headers: List[str], rows: List[List[Any]]):
         print("Keine Daten vorhanden.")
         return
     
-    # Spaltenbreiten berechnen
-    col_widths = [len(h) for h in headers]
-    for row in rows:
-        for i, cell in enumerate(row):
-            col_widths[i] = max(col_widths[i], len(str(cell)))
-    
-    # Kopfzeile ausgeben
+    # Spaltenbreiten in einem Durchlauf pro Spalte berechnen
+    col_widths = [max(len(header), *map(len, map(str, column)))
+                  for header, column in zip(headers, zip(*rows))]
+
+    # Gesamte Tabelle zusammenbauen und mit einem write() ausgeben
     header_row = " | ".join(f"{h:<{w}}" for h, w in zip(headers, col_widths))
-    print(header_row)
-    print("-" * len(header_row))
-    
-    # Datenzeilen ausgeben
-    for row in rows:
-        row_str = " | ".join(f"{str(cell):<{w}}" for cell, w in zip(row, col_widths))
-        print(row_str)
+    lines = [header_row, "-" * len(header_row)]
+    lines.extend(" | ".join(f"{str(cell):<{w}}" for cell, w in zip(row, col_widths))
+                 for row in rows)
+    sys.stdout.write("\n".join(lines) + "\n")
 
 def confirm_action(prompt: str = "Möchten Sie fortfahren?") -> bool:
     """
@@ -128,6 +162,29 @@ def confirm_action(prompt: str = "Möchten Sie fortfahren?") -> bool:
     response = input(f"{prompt} (j/n): ").lower()
     return response in ("j", "ja", "y", "yes")
 
+def parse_int_in_range(value: str, min_value: int, max_value: int) -> Optional[int]:
+    """
+    Parst eine Zeichenkette als Ganzzahl innerhalb eines Bereichs
+
+    Parst den Wert nur einmal, statt ihn erst mit isdigit() zu prüfen
+    und anschließend erneut mit int() zu konvertieren
+
+    Args:
+        value: Zu parsende Zeichenkette
+        min_value: Minimaler Wert
+        max_value: Maximaler Wert
+
+    Returns:
+        int: Geparste Zahl oder None bei ungültiger Eingabe
+    """
+    try:
+        int_value = int(value)
+    except ValueError:
+        return None
+    if min_value <= int_value <= max_value:
+        return int_value
+    return None
+
 def input_int(prompt: str, min_value: int, max_value: int) -> Optional[int]:
     """
     Fordert eine Ganzzahl vom Benutzer an
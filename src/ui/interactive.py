@@ -13,7 +13,14 @@ Ermöglicht die Konfiguration der Maus über ein Menüsystem.
 from typing import Dict, Any, List
 
 from ..config.settings import (MODEL_NAME, SENSOR_MODEL, MAX_DPI, MAX_POLLING_RATE,
-                           DPI_RANGE, POLLING_RATES, LIFT_OFF_DISTANCE, BUTTON_ACTIONS)
+                           DPI_RANGE, POLLING_RATES, POLLING_RATES_SET,
+                           LIFT_OFF_DISTANCE, LIFT_OFF_DISTANCE_SET, BUTTON_ACTIONS)
+from .cli import parse_int_in_range
+
+# Einmal materialisierte Sichten auf BUTTON_ACTIONS, damit das Menü nicht
+# bei jedem Aufruf neue Listen aus dem Dictionary baut
+_BUTTON_ACTION_ITEMS = tuple(BUTTON_ACTIONS.items())
+_BUTTON_ACTION_NAMES = tuple(BUTTON_ACTIONS.keys())
 
 def interactive_cli(mouse):
     """
@@ -77,29 +84,28 @@ def handle_dpi_settings(mouse):
         mouse: PulsarMouse-Objekt
     """
     print("\n--- DPI-Einstellungen ---")
-    active_profile = mouse.config["active_profile"]
-    profile_config = mouse.config["profiles"][active_profile]
+    profile_config = mouse.active_profile_config
     
     # Aktuelle DPI-Stufen anzeigen
     print("Aktuelle DPI-Stufen:")
     for stage, dpi in profile_config["dpi_stages"].items():
-        marker = " *" if int(stage) == profile_config["active_dpi_stage"] else ""
+        marker = " *" if stage == profile_config["active_dpi_stage"] else ""
         print(f"  Stufe {stage}: {dpi} DPI{marker}")
     
     # Stufe auswählen
-    stage = input("\nWelche Stufe möchten Sie ändern? (1-6): ")
-    if not stage.isdigit() or not 1 <= int(stage) <= 6:
+    stage = parse_int_in_range(input("\nWelche Stufe möchten Sie ändern? (1-6): "), 1, 6)
+    if stage is None:
         print("Ungültige Eingabe. Bitte eine Zahl zwischen 1 und 6 eingeben.")
         return
-    
+
     # DPI-Wert eingeben
-    dpi = input(f"Neuer DPI-Wert für Stufe {stage} (50-{MAX_DPI}): ")
-    if not dpi.isdigit() or not 50 <= int(dpi) <= MAX_DPI:
+    dpi = parse_int_in_range(input(f"Neuer DPI-Wert für Stufe {stage} (50-{MAX_DPI}): "), 50, MAX_DPI)
+    if dpi is None:
         print(f"Ungültiger DPI-Wert. Bitte einen Wert zwischen 50 und {MAX_DPI} eingeben.")
         return
-    
+
     # DPI setzen
-    mouse.set_dpi(int(dpi), int(stage))
+    mouse.set_dpi(dpi, stage)
 
 def handle_polling_rate(mouse):
     """
@@ -115,7 +121,7 @@ def handle_polling_rate(mouse):
     print("Hinweis: Rates über 1000Hz erfordern einen speziellen 4K- oder 8K-Dongle.")
     
     rate = input("\nNeue Polling-Rate (125, 250, 500, 1000, 2000, 4000, 8000): ")
-    if not rate.isdigit() or int(rate) not in POLLING_RATES:
+    if not rate.isdigit() or int(rate) not in POLLING_RATES_SET:
         print("Ungültige Eingabe. Bitte eine der verfügbaren Polling-Rates eingeben.")
         return
     
@@ -136,7 +142,7 @@ def handle_liftoff_distance(mouse):
     dist = input("\nNeue Lift-Off-Distanz (0.7, 1.0, 2.0): ")
     try:
         dist_float = float(dist)
-        if dist_float not in LIFT_OFF_DISTANCE:
+        if dist_float not in LIFT_OFF_DISTANCE_SET:
             print("Ungültige Eingabe. Bitte eine der verfügbaren Distanzen eingeben.")
             return
         
@@ -160,22 +166,24 @@ def handle_button_mapping(mouse):
     print("  4: Seitentaste Zurück")
     print("  5: Seitentaste Vorwärts")
     
-    button = input("\nWelche Taste möchten Sie neu belegen? (1-5): ")
-    if not button.isdigit() or not 1 <= int(button) <= 5:
+    button = parse_int_in_range(input("\nWelche Taste möchten Sie neu belegen? (1-5): "), 1, 5)
+    if button is None:
         print("Ungültige Eingabe. Bitte eine Zahl zwischen 1 und 5 eingeben.")
         return
-    
+
     print("\nVerfügbare Aktionen:")
-    for i, (action, code) in enumerate(BUTTON_ACTIONS.items(), 1):
+    for i, (action, code) in enumerate(_BUTTON_ACTION_ITEMS, 1):
         print(f"  {i}: {action} (Code: 0x{code:02x})")
-    
-    action_choice = input("\nWählen Sie eine Aktion (1-{}): ".format(len(BUTTON_ACTIONS)))
-    if not action_choice.isdigit() or not 1 <= int(action_choice) <= len(BUTTON_ACTIONS):
+
+    action_choice = parse_int_in_range(
+        input("\nWählen Sie eine Aktion (1-{}): ".format(len(_BUTTON_ACTION_ITEMS))),
+        1, len(_BUTTON_ACTION_ITEMS))
+    if action_choice is None:
         print("Ungültige Eingabe. Bitte eine gültige Aktionsnummer eingeben.")
         return
-    
-    action_name = list(BUTTON_ACTIONS.keys())[int(action_choice) - 1]
-    mouse.set_button_mapping(int(button), action_name)
+
+    action_name = _BUTTON_ACTION_NAMES[action_choice - 1]
+    mouse.set_button_mapping(button, action_name)
 
 def handle_performance_options(mouse):
     """
@@ -185,13 +193,12 @@ def handle_performance_options(mouse):
         mouse: PulsarMouse-Objekt
     """
     print("\n--- Performance-Optionen ---")
-    active_profile = mouse.config["active_profile"]
-    profile_config = mouse.config["profiles"][active_profile]
+    profile_config = mouse.active_profile_config
     
     print("1. Motion Sync: {}".format("Ein" if profile_config["motion_sync"] else "Aus"))
-    print("2. Ripple Control: {}".format("Ein" if profile_config.get("ripple_control", False) else "Aus"))
-    print("3. Angle Snap: {}".format("Ein" if profile_config.get("angle_snap", False) else "Aus"))
-    print("4. Debounce-Zeit: {} ms".format(profile_config.get("debounce_time", 3)))
+    print("2. Ripple Control: {}".format("Ein" if profile_config["ripple_control"] else "Aus"))
+    print("3. Angle Snap: {}".format("Ein" if profile_config["angle_snap"] else "Aus"))
+    print("4. Debounce-Zeit: {} ms".format(profile_config["debounce_time"]))
     print("5. Zurück")
     
     perf_choice = input("\nWählen Sie eine Option (1-5): ")
@@ -221,23 +228,22 @@ def handle_power_options(mouse):
         mouse: PulsarMouse-Objekt
     """
     print("\n--- Energiesparoptionen ---")
-    active_profile = mouse.config["active_profile"]
-    profile_config = mouse.config["profiles"][active_profile]
+    profile_config = mouse.active_profile_config
     
     print(f"Aktuelle Idle-Zeit: {profile_config['power_saving']['idle_time']} Sekunden")
     print(f"Aktueller Low-Battery-Schwellwert: {profile_config['power_saving']['low_battery_threshold']}%")
     
-    idle_time = input("\nNeue Idle-Zeit in Sekunden (30-900): ")
-    if not idle_time.isdigit() or not 30 <= int(idle_time) <= 900:
+    idle_time = parse_int_in_range(input("\nNeue Idle-Zeit in Sekunden (30-900): "), 30, 900)
+    if idle_time is None:
         print("Ungültige Eingabe. Bitte einen Wert zwischen 30 und 900 eingeben.")
         return
-    
-    threshold = input("Neuer Low-Battery-Schwellwert in Prozent (5-20): ")
-    if not threshold.isdigit() or not 5 <= int(threshold) <= 20:
+
+    threshold = parse_int_in_range(input("Neuer Low-Battery-Schwellwert in Prozent (5-20): "), 5, 20)
+    if threshold is None:
         print("Ungültige Eingabe. Bitte einen Wert zwischen 5 und 20 eingeben.")
         return
-    
-    mouse.set_power_saving(int(idle_time), int(threshold))
+
+    mouse.set_power_saving(idle_time, threshold)
 
 def handle_profile_saving(mouse):
     """
@@ -247,9 +253,9 @@ def handle_profile_saving(mouse):
         mouse: PulsarMouse-Objekt
     """
     print("\n--- Einstellungen in Profil speichern ---")
-    profile = input("In welches Profil möchten Sie speichern? (1-4): ")
-    if not profile.isdigit() or not 1 <= int(profile) <= 4:
+    profile = parse_int_in_range(input("In welches Profil möchten Sie speichern? (1-4): "), 1, 4)
+    if profile is None:
         print("Ungültige Eingabe. Bitte eine Zahl zwischen 1 und 4 eingeben.")
         return
-    
-    mouse.save_to_profile(int(profile))
+
+    mouse.save_to_profile(profile)
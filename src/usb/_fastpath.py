@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2025 Svetlana Sibiryakova
+# /src/usb/_fastpath.py
+# CFFI-Schnellpfad für Bulk-Transfers über libusb-1.0
+# Updated 2025-04-17
+
+"""
+CFFI-Schnellpfad für Bulk-Transfers über libusb-1.0.
+Bindet libusb_bulk_transfer im ABI-Modus direkt an und umgeht damit den
+PyUSB-Dispatcher für skriptgesteuerte Massenaufrufe. Ohne installiertes
+cffi oder auffindbare libusb-Bibliothek bleibt der Pfad einfach inaktiv.
+"""
+
+from typing import Optional
+
+try:
+    from cffi import FFI
+except ImportError:
+    FFI = None
+
+# Lazily initialisierte FFI-Instanz und Bibliothekshandle
+_ffi = None
+_lib = None
+
+# Kandidaten in der Reihenfolge macOS (Homebrew), macOS (voller Name), Linux
+_LIBRARY_NAMES = ("libusb-1.0.dylib", "libusb-1.0.0.dylib", "libusb-1.0.so.0")
+
+def _load() -> bool:
+    """
+    Lädt libusb-1.0 über CFFI, falls noch nicht geschehen
+
+    Returns:
+        bool: True, wenn der Schnellpfad nutzbar ist
+    """
+    global _ffi, _lib
+    if _lib is not None:
+        return True
+    if FFI is None:
+        return False
+
+    ffi = FFI()
+    ffi.cdef("""
+        int libusb_bulk_transfer(void *dev_handle, unsigned char endpoint,
+                                 unsigned char *data, int length,
+                                 int *transferred, unsigned int timeout);
+    """)
+    for name in _LIBRARY_NAMES:
+        try:
+            _lib = ffi.dlopen(name)
+            _ffi = ffi
+            return True
+        except OSError:
+            continue
+    return False
+
+def available() -> bool:
+    """
+    Prüft, ob der CFFI-Schnellpfad verfügbar ist
+
+    Returns:
+        bool: True, wenn cffi installiert ist und libusb-1.0 geladen werden kann
+    """
+    return _load()
+
+class FastPath:
+    """
+    Dünner Wrapper um libusb_bulk_transfer mit vorallokierten Puffern.
+    Eine Instanz gehört zu genau einem geöffneten Gerätehandle.
+    """
+
+    __slots__ = ('_handle', '_buf', '_transferred')
+
+    def __init__(self, handle_ptr: int):
+        """
+        Initialisiert den Schnellpfad für ein geöffnetes Gerät
+
+        Args:
+            handle_ptr: Zeigerwert des libusb_device_handle, wie ihn das
+                PyUSB-libusb1-Backend intern hält
+        """
+        self._handle = _ffi.cast("void *", handle_ptr)
+        self._buf = _ffi.new("unsigned char[64]")
+        self._transferred = _ffi.new("int *")
+
+    def bulk_write(self, endpoint: int, data: bytes, timeout: int = 300) -> int:
+        """
+        Schreibt Daten per libusb_bulk_transfer auf einen OUT-Endpunkt
+
+        Args:
+            endpoint: Adresse des OUT-Endpunkts
+            data: Zu sendende Bytes (höchstens 64)
+            timeout: Timeout in Millisekunden
+
+        Returns:
+            int: Anzahl der übertragenen Bytes
+
+        Raises:
+            OSError: Wenn libusb einen Fehlercode zurückgibt
+        """
+        length = len(data)
+        _ffi.memmove(self._buf, data, length)
+        ret = _lib.libusb_bulk_transfer(self._handle, endpoint, self._buf,
+                                        length, self._transferred, timeout)
+        if ret != 0:
+            raise OSError(f"libusb_bulk_transfer fehlgeschlagen (Code {ret})")
+        return self._transferred[0]
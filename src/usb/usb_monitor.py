@@ -10,6 +10,8 @@ USB-Monitor für das Reverse Engineering der Pulsar X2.
 Überwacht die USB-Kommunikation und protokolliert Befehle und Antworten.
 """
 
+import csv
+import io
 import sys
 import time
 import argparse
@@ -18,8 +20,36 @@ import usb.util
 from datetime import datetime
 from typing import Optional, Tuple, List
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 from ..config.settings import VENDOR_ID, PRODUCT_ID, MODEL_NAME
 
+# Cache für die Zeitstempel-Formatierung: strftime nur einmal pro Sekunde,
+# die Millisekunden kommen per Ganzzahlarithmetik dazu
+_last_sec = 0
+_last_prefix = ''
+
+def _format_timestamp() -> str:
+    """
+    Formatiert die aktuelle Zeit als 'YYYY-MM-DD HH:MM:SS.mmm'
+
+    Deutlich billiger als datetime.now().strftime() pro Paket, da der
+    Datums-/Sekundenteil nur bei einem Sekundenwechsel neu formatiert wird
+
+    Returns:
+        str: Formatierter Zeitstempel mit Millisekunden
+    """
+    global _last_sec, _last_prefix
+    t = time.time()
+    sec = int(t)
+    if sec != _last_sec:
+        _last_prefix = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(sec))
+        _last_sec = sec
+    return f"{_last_prefix}.{int((t - sec) * 1000):03d}"
+
 def find_device():
     """
     Sucht nach der Pulsar X2 und gibt das Geräteobjekt zurück
@@ -77,45 +107,61 @@ def find_endpoints(device) -> Tuple[usb.core.Endpoint, usb.core.Endpoint]:
     Raises:
         SystemExit: Wenn die Endpunkte nicht gefunden werden können
     """
+    # Bereits aufgelöste Endpunkte wiederverwenden, damit wiederholte
+    # send_command-Aufrufe nicht jedes Mal den Deskriptorbaum durchlaufen
+    cached = getattr(device, '_pulsar_endpoints', None)
+    if cached is not None:
+        return cached
+
     cfg = device.get_active_configuration()
     interface = cfg[(0,0)]
-    
-    ep_in = usb.util.find_descriptor(
-        interface,
-        custom_match=lambda e: usb.util.endpoint_direction(e.bEndpointAddress) == usb.util.ENDPOINT_IN
-    )
-    
-    ep_out = usb.util.find_descriptor(
-        interface,
-        custom_match=lambda e: usb.util.endpoint_direction(e.bEndpointAddress) == usb.util.ENDPOINT_OUT
-    )
-    
+
+    # Ein einziger Durchlauf über die Endpunkte; Bit 7 der Adresse ist das
+    # Richtungsflag, der Umweg über find_descriptor mit Lambda entfällt
+    ep_in = None
+    ep_out = None
+    for endpoint in interface:
+        if endpoint.bEndpointAddress & 0x80:
+            if ep_in is None:
+                ep_in = endpoint
+        elif ep_out is None:
+            ep_out = endpoint
+
     if ep_in is None or ep_out is None:
         print("Fehler: Konnte die Endpunkte nicht finden.")
         sys.exit(1)
     
     print(f"IN-Endpunkt gefunden: 0x{ep_in.bEndpointAddress:02x}")
     print(f"OUT-Endpunkt gefunden: 0x{ep_out.bEndpointAddress:02x}")
-    
+
+    device._pulsar_endpoints = (ep_in, ep_out)
     return ep_in, ep_out
 
-def monitor_traffic(device, duration=60, log_file=None):
+def monitor_traffic(device, duration=60, log_file=None, quiet=False):
     """
     Überwacht die USB-Kommunikation für eine bestimmte Zeit
-    
+
     Args:
         device: USB-Geräteobjekt
         duration: Überwachungsdauer in Sekunden
         log_file: Optional, Dateiname für die Protokollierung
+        quiet: Pakete nicht einzeln ausgeben, sondern nur einmal pro
+            Sekunde einen Zähler aktualisieren (sinnvoll beim Protokollieren
+            hoher Polling-Raten, wo das Terminal zum Engpass wird)
     """
     ep_in, ep_out = find_endpoints(device)
     
-    # Log-Datei öffnen, falls angegeben
+    # Log-Datei öffnen, falls angegeben; 64-KB-Puffer, damit nicht jedes
+    # Paket einen eigenen write()-Syscall auslöst. csv.writer formatiert
+    # die Zeilen in C und kümmert sich um das Quoting
     log_handle = None
+    log_writer = None
     if log_file:
         try:
-            log_handle = open(log_file, 'w')
-            log_handle.write("Zeitstempel,Richtung,Daten\n")
+            raw = open(log_file, 'wb', buffering=65536)
+            log_handle = io.TextIOWrapper(raw, newline='')
+            log_writer = csv.writer(log_handle)
+            log_writer.writerow(["Zeitstempel", "Richtung", "Daten"])
             print(f"Protokollierung in '{log_file}' gestartet.")
         except IOError as e:
             print(f"Fehler beim Öffnen der Log-Datei: {e}")
@@ -126,32 +172,58 @@ def monitor_traffic(device, duration=60, log_file=None):
     print("Drücken Sie Strg+C, um die Überwachung vorzeitig zu beenden.\n")
     
     end_time = time.time() + duration
+    last_flush = time.time()
+    unflushed = 0
+    pkt_count = 0
+    last_print = time.time()
     try:
         while time.time() < end_time:
-            # Versuchen, Daten vom IN-Endpunkt zu lesen (von der Maus zum Computer)
+            # Versuchen, Daten vom IN-Endpunkt zu lesen (von der Maus zum
+            # Computer). read() blockiert bereits bis zum Timeout, ein
+            # zusätzliches sleep würde nur Latenz hinzufügen; 50 ms halten
+            # die Reaktionszeit auf Strg+C kurz
             try:
-                data = device.read(ep_in.bEndpointAddress, ep_in.wMaxPacketSize, timeout=100)
+                data = device.read(ep_in.bEndpointAddress, ep_in.wMaxPacketSize, timeout=50)
                 if data:
-                    timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f')[:-3]
-                    data_str = ' '.join([f'{b:02x}' for b in data])
-                    print(f"[{timestamp}] IN: {data_str}")
-                    
+                    timestamp = _format_timestamp()
+                    # read() liefert ein array.array('B'); einmal nach bytes
+                    # konvertieren und für Log und Ausgabe wiederverwenden
+                    data_str = data.tobytes().hex(' ')
+                    pkt_count += 1
+
+                    if quiet:
+                        # Bei 1-8 kHz Polling würde jede einzelne Zeile das
+                        # Terminal-Rendering zum Engpass machen; stattdessen
+                        # nur einmal pro Sekunde den Zähler aktualisieren
+                        if time.time() - last_print > 1.0:
+                            sys.stdout.write(f"\r{pkt_count} Pakete empfangen...")
+                            sys.stdout.flush()
+                            last_print = time.time()
+                    else:
+                        print(f"[{timestamp}] IN: {data_str}")
+
+
                     if log_handle:
-                        log_handle.write(f"{timestamp},IN,{data_str}\n")
-                        log_handle.flush()
+                        log_writer.writerow((timestamp, "IN", data_str))
+                        # Nur zeit- bzw. mengenbasiert flushen statt pro Paket
+                        unflushed += 1
+                        if unflushed >= 256 or time.time() - last_flush > 1.0:
+                            log_handle.flush()
+                            last_flush = time.time()
+                            unflushed = 0
             except usb.core.USBError as e:
                 if e.errno != 110:  # Timeout-Fehler ignorieren
                     print(f"Fehler beim Lesen vom IN-Endpunkt: {e}")
-            
-            # Warten, um die CPU-Auslastung zu reduzieren
-            time.sleep(0.01)
-    
+
     except KeyboardInterrupt:
         print("\nÜberwachung durch Benutzer beendet.")
     
     finally:
+        if quiet and pkt_count:
+            sys.stdout.write(f"\r{pkt_count} Pakete empfangen.{' ' * 10}\n")
         print("\nÜberwachung beendet.")
         if log_handle:
+            log_handle.flush()
             log_handle.close()
             print(f"Protokoll gespeichert in '{log_file}'.")
 
@@ -172,7 +244,7 @@ def send_command(device, command: List[int], description=None):
     if description:
         print(f"\nSende Befehl: {description}")
     
-    cmd_str = ' '.join([f'{b:02x}' for b in command])
+    cmd_str = bytes(command).hex(' ')
     print(f"OUT: {cmd_str}")
     
     try:
@@ -184,7 +256,7 @@ def send_command(device, command: List[int], description=None):
             time.sleep(0.1)  # Kurze Pause für die Verarbeitung
             response = device.read(ep_in.bEndpointAddress, ep_in.wMaxPacketSize, timeout=300)
             
-            resp_str = ' '.join([f'{b:02x}' for b in response])
+            resp_str = response.tobytes().hex(' ')
             print(f"IN: {resp_str}")
             return response
         except usb.core.USBError as e:
@@ -206,38 +278,49 @@ def analyze_log(log_file: str):
         log_file: Pfad zur Protokolldatei
     """
     print(f"Analysiere Protokolldatei: {log_file}")
-    
+
+    # Den gesamten Bericht erst in einem StringIO sammeln und am Ende mit
+    # einem einzigen write() ausgeben; bei langen Protokollen dominieren
+    # sonst die vielen kleinen print()-Aufrufe auf dem Terminal
+    buf = io.StringIO()
+
     try:
-        with open(log_file, 'r') as f:
-            lines = f.readlines()
-            
-        if len(lines) <= 1:
-            print("Protokolldatei ist leer oder enthält nur die Kopfzeile.")
-            return
-            
-        # Kopfzeile überspringen
-        data_lines = lines[1:]
         in_packets = []
         out_packets = []
-        
-        for line in data_lines:
-            parts = line.strip().split(',')
-            if len(parts) < 3:
-                continue
-                
-            timestamp, direction, data_str = parts
-            data = [int(b, 16) for b in data_str.split()]
-            
-            if direction == "IN":
-                in_packets.append((timestamp, data))
-            elif direction == "OUT":
-                out_packets.append((timestamp, data))
-        
-        print(f"Insgesamt {len(in_packets)} IN-Pakete und {len(out_packets)} OUT-Pakete gefunden.")
-        
+
+        # Zeilenweise per csv.reader streamen statt die ganze Datei mit
+        # readlines() in den Speicher zu ziehen; der 1-MB-Puffer hält die
+        # Zahl der read()-Syscalls bei großen Protokollen klein
+        with open(log_file, 'r', newline='', buffering=1 << 20) as f:
+            reader = csv.reader(f)
+
+            # Kopfzeile überspringen
+            if next(reader, None) is None:
+                print("Protokolldatei ist leer oder enthält nur die Kopfzeile.", file=buf)
+                return
+
+            for parts in reader:
+                if len(parts) < 3:
+                    continue
+
+                timestamp, direction, data_str = parts
+                # bytes.fromhex ist C-implementiert und spart N int()-Aufrufe
+                data = bytes.fromhex(data_str.replace(' ', ''))
+
+                if direction == "IN":
+                    in_packets.append((timestamp, data))
+                elif direction == "OUT":
+                    out_packets.append((timestamp, data))
+
+        if not in_packets and not out_packets:
+            print("Protokolldatei ist leer oder enthält nur die Kopfzeile.", file=buf)
+            return
+
+        print(f"Insgesamt {len(in_packets)} IN-Pakete und {len(out_packets)} OUT-Pakete gefunden.", file=buf)
+
         # Häufig vorkommende Befehlsmuster identifizieren
         if out_packets:
-            print("\nHäufig vorkommende Befehlsmuster:")
+            print("\nHäufig vorkommende Befehlsmuster:", file=buf)
             
             # Pakete nach dem ersten Byte gruppieren (Befehlstyp)
             command_groups = {}
@@ -253,46 +336,71 @@ def analyze_log(log_file: str):
             
             # Häufigste Befehle ausgeben
             for cmd_type, commands in sorted(command_groups.items()):
-                print(f"\nBefehlstyp 0x{cmd_type:02x} ({len(commands)} Vorkommen):")
-                
+                print(f"\nBefehlstyp 0x{cmd_type:02x} ({len(commands)} Vorkommen):", file=buf)
+
                 # Beispiele anzeigen
                 for i, cmd in enumerate(commands[:3]):
                     cmd_str = ' '.join([f'{b:02x}' for b in cmd])
-                    print(f"  Beispiel {i+1}: {cmd_str}")
+                    print(f"  Beispiel {i+1}: {cmd_str}", file=buf)
                 
                 # Variationen in den Parametern identifizieren
                 if len(commands) > 1 and len(commands[0]) > 1:
                     variations = []
-                    for byte_pos in range(1, len(commands[0])):
-                        values = set(cmd[byte_pos] for cmd in commands if len(cmd) > byte_pos)
-                        if len(values) > 1:
-                            variations.append((byte_pos, values))
-                    
+                    if np is not None:
+                        # Gleich lange Befehle zu 2D-Arrays stapeln und die
+                        # Spalten vektorisiert mit np.unique untersuchen statt
+                        # pro Byteposition alle Befehle in Python zu iterieren
+                        by_length = {}
+                        for cmd in commands:
+                            by_length.setdefault(len(cmd), []).append(cmd)
+
+                        value_sets = {}
+                        for length, group in by_length.items():
+                            arr = np.frombuffer(b''.join(group), dtype=np.uint8).reshape(len(group), length)
+                            for byte_pos in range(1, length):
+                                unique = np.unique(arr[:, byte_pos])
+                                value_sets.setdefault(byte_pos, set()).update(unique.tolist())
+
+                        variations = [(byte_pos, values)
+                                      for byte_pos, values in sorted(value_sets.items())
+                                      if len(values) > 1]
+                    else:
+                        for byte_pos in range(1, len(commands[0])):
+                            values = set(cmd[byte_pos] for cmd in commands if len(cmd) > byte_pos)
+                            if len(values) > 1:
+                                variations.append((byte_pos, values))
+
                     if variations:
-                        print("  Parameteränderungen:")
+                        print("  Parameteränderungen:", file=buf)
                         for byte_pos, values in variations:
                             val_str = ', '.join([f'0x{v:02x}' for v in sorted(values)])
-                            print(f"    Byte {byte_pos}: {val_str}")
-        
+                            print(f"    Byte {byte_pos}: {val_str}", file=buf)
+
         # Korrelationen zwischen Befehlen und Antworten
         if out_packets and in_packets:
-            print("\nKorrelation zwischen Befehlen und Antworten:")
+            print("\nKorrelation zwischen Befehlen und Antworten:", file=buf)
             
-            # Einfache zeitbasierte Korrelation
+            # Einfache zeitbasierte Korrelation. Beide Listen sind zeitlich
+            # sortiert, daher genügt ein Durchlauf mit zwei Zeigern statt
+            # des verschachtelten Scans; jeder Zeitstempel wird nur einmal
+            # mit strptime geparst
             max_time_diff = 0.5  # 500ms
             correlated_pairs = []
-            
-            for out_ts, out_data in out_packets:
-                out_time = datetime.strptime(out_ts, '%Y-%m-%d %H:%M:%S.%f')
-                
-                # Nächste Antwort nach diesem Befehl finden
-                for in_ts, in_data in in_packets:
-                    in_time = datetime.strptime(in_ts, '%Y-%m-%d %H:%M:%S.%f')
-                    time_diff = (in_time - out_time).total_seconds()
-                    
-                    if 0 < time_diff < max_time_diff:
-                        correlated_pairs.append((out_data, in_data, time_diff))
-                        break
+
+            time_format = '%Y-%m-%d %H:%M:%S.%f'
+            out_times = [datetime.strptime(ts, time_format).timestamp() for ts, _ in out_packets]
+            in_times = [datetime.strptime(ts, time_format).timestamp() for ts, _ in in_packets]
+
+            in_idx = 0
+            for (_, out_data), out_time in zip(out_packets, out_times):
+                # Zum ersten IN-Paket nach diesem Befehl vorrücken
+                while in_idx < len(in_times) and in_times[in_idx] <= out_time:
+                    in_idx += 1
+
+                if in_idx < len(in_times):
+                    time_diff = in_times[in_idx] - out_time
+                    if time_diff < max_time_diff:
+                        correlated_pairs.append((out_data, in_packets[in_idx][1], time_diff))
             
             # Beispiele für korrelierte Paare anzeigen
             for i, (out_data, in_data, time_diff) in enumerate(correlated_pairs[:5]):
@@ -301,17 +409,20 @@ def analyze_log(log_file: str):
                     
                 out_str = ' '.join([f'{b:02x}' for b in out_data])
                 in_str = ' '.join([f'{b:02x}' for b in in_data])
-                print(f"\nPaar {i+1} (Zeitdifferenz: {time_diff*1000:.1f}ms):")
-                print(f"  Befehl:  {out_str}")
-                print(f"  Antwort: {in_str}")
-            
+                print(f"\nPaar {i+1} (Zeitdifferenz: {time_diff*1000:.1f}ms):", file=buf)
+                print(f"  Befehl:  {out_str}", file=buf)
+                print(f"  Antwort: {in_str}", file=buf)
+
             if len(correlated_pairs) > 5:
-                print(f"\n... und {len(correlated_pairs) - 5} weitere Paare.")
-        
-        print("\nProtokollanalyse abgeschlossen.")
-        
+                print(f"\n... und {len(correlated_pairs) - 5} weitere Paare.", file=buf)
+
+        print("\nProtokollanalyse abgeschlossen.", file=buf)
+
     except Exception as e:
-        print(f"Fehler bei der Analyse der Protokolldatei: {e}")
+        print(f"Fehler bei der Analyse der Protokolldatei: {e}", file=buf)
+
+    finally:
+        sys.stdout.write(buf.getvalue())
 
 def main():
     """Hauptfunktion des USB-Monitors"""
@@ -320,6 +431,7 @@ def main():
     parser.add_argument('--monitor', '-m', action='store_true', help='USB-Verkehr überwachen')
     parser.add_argument('--duration', '-d', type=int, default=60, help='Überwachungsdauer in Sekunden (Standard: 60)')
     parser.add_argument('--log', '-l', type=str, help='Dateiname für die Protokollierung')
+    parser.add_argument('--quiet', '-q', action='store_true', help='Pakete nicht einzeln ausgeben, nur Zähler anzeigen')
     parser.add_argument('--command', '-c', type=str, help='Befehl an die Maus senden (Hex-Bytes, durch Leerzeichen getrennt)')
     parser.add_argument('--description', type=str, help='Beschreibung des Befehls')
     parser.add_argument('--analyze', '-a', type=str, help='Protokolldatei analysieren')
@@ -347,7 +459,7 @@ def main():
         
         elif args.monitor or not (args.command or args.analyze):
             # USB-Verkehr überwachen (Standard, wenn kein anderer Befehl angegeben wurde)
-            monitor_traffic(device, args.duration, args.log)
+            monitor_traffic(device, args.duration, args.log, args.quiet)
         
         else:
             parser.print_help()
@@ -10,37 +10,105 @@ Implementierung des USB-Kommunikationsprotokolls für Pulsar X2.
 Bietet Klassen und Funktionen für die direkte Kommunikation mit dem Gerät.
 """
 
-import time
-import usb.core
-import usb.util
+import array
+
+from bisect import bisect_left
+from contextlib import contextmanager
+from functools import reduce
+from operator import xor
 from typing import List, Dict, Any, Optional, Tuple
 
+try:
+    # Optionaler libusb1-Backend: bulkWrite nimmt Puffer ohne die
+    # elementweise ctypes-Konvertierung des synchronen PyUSB-Pfads an
+    import usb1
+except ImportError:
+    usb1 = None
+
 from ..config.settings import (VENDOR_ID, PRODUCT_ID, MODEL_NAME, SENSOR_MODEL,
                              MAX_DPI, MAX_POLLING_RATE, DPI_RANGE, DEFAULT_DPI_STAGES,
                              POLLING_RATES, LIFT_OFF_DISTANCE, BUTTON_ACTIONS,
-                             CMD_GET_INFO, CMD_GET_SETTINGS, CMD_SET_DPI, CMD_SET_POLLING,
+                             POLLING_CODE, POLLING_RATES_SORTED,
+                             LIFTOFF_CODE, LIFT_OFF_DISTANCE_SORTED,
+                             CMD_GET_INFO, CMD_GET_SETTINGS, CMD_SET_DPI,
+                             CMD_SET_DPI_BATCH, CMD_SET_POLLING,
                              CMD_SET_LIFTOFF, CMD_SET_BUTTON, CMD_SET_MOTION_SYNC,
                              CMD_SET_POWER, CMD_SAVE_PROFILE)
-from ..config.profiles import load_config, save_config, print_profile_settings
+from ..config.profiles import load_config, save_config
+
+def _append_checksum(command: bytearray) -> bytearray:
+    """
+    Hängt eine XOR-Prüfsumme über alle Befehlsbytes an
+
+    Die bekannten Einstellungsbefehle kommen ohne Prüfsumme aus; für
+    Transfers, die eine verlangen (z. B. Firmware-Blöcke), kann
+    send_command sie per checksum=True anfügen. reduce/xor iteriert
+    in C statt in einer Python-Schleife über die Bytes
+
+    Args:
+        command: Befehlsbytes ohne Prüfsumme
+
+    Returns:
+        bytearray: Derselbe Puffer mit angehängtem Prüfsummenbyte
+    """
+    command.append(reduce(xor, command, 0))
+    return command
 
 class PulsarMouse:
     """
     Hauptklasse für die Kommunikation mit Pulsar über USB.
     Stellt Methoden für alle Mauseinstellungen bereit.
     """
-    def __init__(self, debug_mode=False):
+
+    # Einmal pro Prozess ermittelt, ob PyUSB die Kernel-Treiber-API
+    # unterstützt; unter macOS fehlt sie häufig und jeder connect würde
+    # sonst eine NotImplementedError-Ausnahme konstruieren und fangen
+    _HAS_KERNEL_DRIVER_API: Optional[bool] = None
+
+    def __init__(self, debug_mode=False, backend='pyusb', verbose=True):
         """
         Initialisiert die Verbindung zur Maus
-        
+
         Args:
             debug_mode: Wenn True, werden keine tatsächlichen USB-Befehle gesendet
+            backend: 'pyusb' (Standard) oder 'libusb1'; letzteres nutzt das
+                usb1-Modul mit vorallokierten Puffern und fällt auf PyUSB
+                zurück, wenn usb1 nicht installiert ist
+            verbose: Wenn False, werden Fortschrittsmeldungen der Setter
+                unterdrückt; Warnungen und Fehler erscheinen weiterhin
         """
         self.debug_mode = debug_mode
+        self._verbose = verbose
+        self.backend = backend if backend == 'libusb1' and usb1 is not None else 'pyusb'
+        self._ctx = None
+        self._handle = None
+        self._pending_read = None
+        # Vorallokierte Übertragungspuffer, damit pro Befehl keine neuen
+        # Puffer entstehen; _resp_buf wird nach dem Auflösen der Endpunkte
+        # auf wMaxPacketSize dimensioniert
+        self._tx_buf = bytearray(64)
+        self._resp_buf = None
+        # CFFI-Schnellpfad (siehe _fastpath.py); None = noch nicht probiert,
+        # False = nicht verfügbar, sonst eine FastPath-Instanz
+        self._fastpath = None
         self.device = None
         self.ep_in = None
         self.ep_out = None
+        self._ep_in_addr = None
+        self._ep_out_addr = None
+        self._ep_in_maxpkt = None
         self.config = load_config()
-        
+
+        # Generationszähler für die memoisierte Profil-Sicht; jede
+        # Einstellung, die die Konfiguration ändert, erhöht _cfg_gen
+        self._cfg_gen = 0
+        self._cached_gen = -1
+        self._cached_cfg = None
+
+        # Schachtelungstiefe von batch(); solange > 0, wird save_config
+        # in den Settern aufgeschoben
+        self._batch_depth = 0
+
         # Verbindung zur Maus herstellen, wenn nicht im Debug-Modus
         if not debug_mode:
             try:
@@ -50,6 +118,22 @@ class PulsarMouse:
                 print("Führen Sie das Programm im Debug-Modus aus, um ohne Maus fortzufahren.")
                 print("  --debug")
     
+    @property
+    def active_profile_config(self) -> Dict[str, Any]:
+        """
+        Konfiguration des aktiven Profils
+
+        Memoisiert über den Generationszähler: solange keine Einstellung
+        geändert wurde, entfällt der doppelte Dictionary-Zugriff
+
+        Returns:
+            Dict[str, Any]: Konfiguration des aktiven Profils
+        """
+        if self._cached_gen != self._cfg_gen:
+            self._cached_cfg = self.config["profiles"][self.config["active_profile"]]
+            self._cached_gen = self._cfg_gen
+        return self._cached_cfg
+
     def connect(self) -> bool:
         """
         Verbindung zur Maus herstellen
@@ -57,6 +141,14 @@ class PulsarMouse:
         Returns:
             bool: True bei erfolgreicher Verbindung, sonst False
         """
+        if self.backend == 'libusb1':
+            return self._connect_libusb1()
+
+        # Erst hier importieren: pyusb lädt das libusb-Backend per ctypes,
+        # was den Start im Debug-Modus unnötig verlangsamen würde; nach dem
+        # ersten Aufruf greift der sys.modules-Cache
+        import usb.core
+
         try:
             # Maus anhand von Vendor- und Product-ID finden
             self.device = usb.core.find(idVendor=VENDOR_ID, idProduct=PRODUCT_ID)
@@ -66,20 +158,25 @@ class PulsarMouse:
                 print("Stellen Sie sicher, dass die Maus angeschlossen ist.")
                 return False
         
-            # macOS-spezifische Prüfung für den Kernel-Treiber
-            try:
-                # Falls die Maus von einem Kernel-Treiber verwendet wird, diesen lösen
-                if self.device.is_kernel_driver_active(0):
-                    try:
-                        self.device.detach_kernel_driver(0)
-                        print("Kernel-Treiber getrennt")
-                    except usb.core.USBError as e:
-                        # Unter macOS ist dies möglicherweise gar nicht nötig
-                        print(f"Hinweis: Konnte Kernel-Treiber nicht trennen: {e}")
-                        # Trotzdem fortfahren, da macOS oft keinen Treiber zu trennen hat
-            except (AttributeError, NotImplementedError):
-                # Manche macOS-Versionen unterstützen is_kernel_driver_active nicht
-                print("Hinweis: Kernel-Treiber-Status konnte nicht geprüft werden (typisch für macOS)")
+            # macOS-spezifische Prüfung für den Kernel-Treiber; ob die API
+            # verfügbar ist, wird nur beim ersten connect per Exception
+            # ermittelt und danach über das Klassenattribut übersprungen
+            if PulsarMouse._HAS_KERNEL_DRIVER_API is not False:
+                try:
+                    # Falls die Maus von einem Kernel-Treiber verwendet wird, diesen lösen
+                    if self.device.is_kernel_driver_active(0):
+                        try:
+                            self.device.detach_kernel_driver(0)
+                            print("Kernel-Treiber getrennt")
+                        except usb.core.USBError as e:
+                            # Unter macOS ist dies möglicherweise gar nicht nötig
+                            print(f"Hinweis: Konnte Kernel-Treiber nicht trennen: {e}")
+                            # Trotzdem fortfahren, da macOS oft keinen Treiber zu trennen hat
+                    PulsarMouse._HAS_KERNEL_DRIVER_API = True
+                except (AttributeError, NotImplementedError):
+                    # Manche macOS-Versionen unterstützen is_kernel_driver_active nicht
+                    PulsarMouse._HAS_KERNEL_DRIVER_API = False
+                    print("Hinweis: Kernel-Treiber-Status konnte nicht geprüft werden (typisch für macOS)")
         
             # Konfiguration einrichten
             try:
@@ -115,69 +212,158 @@ class PulsarMouse:
                     intf = interface
                     break
         
-            # Endpunkt für Datenempfang (von Maus zum Computer)
-            self.ep_in = usb.util.find_descriptor(
-                intf,
-                custom_match=lambda e: usb.util.endpoint_direction(e.bEndpointAddress) == usb.util.ENDPOINT_IN
-            )
-        
-            # Endpunkt für Datenübertragung (vom Computer zur Maus)
-            self.ep_out = usb.util.find_descriptor(
-                intf,
-                custom_match=lambda e: usb.util.endpoint_direction(e.bEndpointAddress) == usb.util.ENDPOINT_OUT
-            )
-        
+            # Ein einziger Durchlauf über die Endpunkte; Bit 7 der Adresse
+            # ist das Richtungsflag, der Umweg über find_descriptor mit
+            # Lambda entfällt. Bei einem erneuten connect zuvor aufgelöste
+            # Endpunkte verwerfen
+            self.ep_in = None
+            self.ep_out = None
+            for endpoint in intf:
+                if endpoint.bEndpointAddress & 0x80:
+                    if self.ep_in is None:
+                        self.ep_in = endpoint
+                elif self.ep_out is None:
+                    self.ep_out = endpoint
+                if self.ep_in is not None and self.ep_out is not None:
+                    break
+
+
             if not self.ep_in or not self.ep_out:
                 raise ValueError("Konnte Endpunkte für Datenübertragung nicht finden")
-            
-            print(f"Endpunkte gefunden - IN: 0x{self.ep_in.bEndpointAddress:02x}, OUT: 0x{self.ep_out.bEndpointAddress:02x}")
+
+            # Adressen und Paketgröße einmal als int zwischenspeichern;
+            # die Attributzugriffe auf den PyUSB-Endpunktobjekten laufen
+            # sonst bei jedem send_command durch die Deskriptortabellen
+            self._ep_in_addr = int(self.ep_in.bEndpointAddress)
+            self._ep_out_addr = int(self.ep_out.bEndpointAddress)
+            self._ep_in_maxpkt = int(self.ep_in.wMaxPacketSize)
+            # PyUSB liest nur in ein array.array in-place; andere Puffertypen
+            # reicht read() an usb.util.create_buffer() weiter
+            self._resp_buf = array.array('B', bytes(self._ep_in_maxpkt))
+
+            print(f"Endpunkte gefunden - IN: 0x{self._ep_in_addr:02x}, OUT: 0x{self._ep_out_addr:02x}")
         
         except Exception as e:
             print(f"Fehler beim Finden der Endpunkte: {e}")
             print("Dies könnte an fehlenden Berechtigungen oder einem inkompatiblen USB-Treiber liegen.")
             raise
-    
-    def send_command(self, command: List[int], expect_response=True, timeout=300):
+
+    def _connect_libusb1(self) -> bool:
+        """
+        Verbindung über den libusb1-Backend herstellen
+
+        Returns:
+            bool: True bei erfolgreicher Verbindung, sonst False
+        """
+        try:
+            self._ctx = usb1.USBContext()
+            self._handle = self._ctx.openByVendorIDAndProductID(
+                VENDOR_ID, PRODUCT_ID, skip_on_error=True)
+
+            if self._handle is None:
+                print("Pulsar X2 nicht gefunden.")
+                print("Stellen Sie sicher, dass die Maus angeschlossen ist.")
+                return False
+
+            try:
+                if self._handle.kernelDriverActive(0):
+                    self._handle.detachKernelDriver(0)
+                    print("Kernel-Treiber getrennt")
+            except usb1.USBError:
+                # Unter macOS ist dies möglicherweise gar nicht nötig
+                pass
+
+            self._handle.claimInterface(0)
+
+            # Endpunkte aus den Deskriptoren ermitteln; Bit 7 der Adresse
+            # ist das Richtungsflag
+            for settings in self._handle.getDevice().iterSettings():
+                for endpoint in settings.iterEndpoints():
+                    addr = endpoint.getAddress()
+                    if addr & 0x80:
+                        if self._ep_in_addr is None:
+                            self._ep_in_addr = addr
+                            self._ep_in_maxpkt = endpoint.getMaxPacketSize()
+                    elif self._ep_out_addr is None:
+                        self._ep_out_addr = addr
+                if self._ep_in_addr is not None and self._ep_out_addr is not None:
+                    break
+
+            if self._ep_in_addr is None or self._ep_out_addr is None:
+                print("Fehler: Konnte die Endpunkte nicht finden.")
+                self._handle = None
+                return False
+
+            print(f"Verbindung zu Pulsar {MODEL_NAME} hergestellt (libusb1).")
+            print(f"Endpunkte gefunden - IN: 0x{self._ep_in_addr:02x}, OUT: 0x{self._ep_out_addr:02x}")
+            return True
+
+        except Exception as e:
+            print(f"Fehler beim Verbinden mit der Maus: {e}")
+            self._handle = None
+            return False
+
+    def send_command(self, command: bytes, expect_response=True, timeout=300,
+                     checksum=False):
         """
         Sendet einen Befehl an die Maus und liest ggf. eine Antwort
-        
+
         Args:
-            command: Liste von Bytes, die gesendet werden sollen
+            command: Zu sendende Befehlsbytes (bytes oder bytearray);
+                werden unverändert an device.write durchgereicht, damit
+                PyUSB keine Python-Liste konvertieren muss
             expect_response: Ob eine Antwort erwartet wird
             timeout: Timeout in Millisekunden
-            
+            checksum: Wenn True, wird vor dem Senden eine XOR-Prüfsumme
+                über die Befehlsbytes angehängt
+
         Returns:
             Die Antwort der Maus oder None
         """
+        if checksum:
+            command = _append_checksum(bytearray(command))
+
         if self.debug_mode:
-            cmd_str = ' '.join([f'{b:02x}' for b in command])
-            print(f"DEBUG - Befehl senden: {cmd_str}")
+            if self._verbose:
+                print(f"DEBUG - Befehl senden: {bytes(command).hex(' ')}")
             # Im Debug-Modus eine Dummy-Antwort zurückgeben
             return bytearray([0] * 8) if expect_response else None
         
+        if self._handle is not None:
+            return self._send_command_libusb1(command, expect_response, timeout)
+
         if not self.device or not self.ep_out:
             print("Keine Verbindung zur Maus. Befehl kann nicht gesendet werden.")
             return None
-        
+
+        import usb.core
+
         try:
-            # Befehl an die Maus senden
-            bytes_sent = self.device.write(self.ep_out.bEndpointAddress, command)
-            cmd_str = ' '.join([f'{b:02x}' for b in command])
-            print(f"Befehl gesendet ({bytes_sent} Bytes): {cmd_str}")
-            
+            # Befehl über den persistenten Sendepuffer an die Maus senden;
+            # das memoryview-Fenster erspart PyUSB eine Pufferkopie pro Befehl
+            length = len(command)
+            self._tx_buf[:length] = command
+            bytes_sent = self.device.write(self._ep_out_addr,
+                                           memoryview(self._tx_buf)[:length])
+            if self._verbose:
+                cmd_str = bytes(command).hex(' ')
+                print(f"Befehl gesendet ({bytes_sent} Bytes): {cmd_str}")
+
             if not expect_response:
                 return None
-            
-            # Kurze Pause für die Verarbeitung
-            time.sleep(0.05)
-            
-            # Antwort von der Maus lesen
+
+            # Antwort von der Maus lesen; read() blockiert bereits bis die
+            # Antwort eintrifft bzw. der Timeout abläuft, eine zusätzliche
+            # feste Pause würde jeden Befehl nur um 50 ms verteuern.
+            # read() füllt den vorallokierten Antwortpuffer, statt pro
+            # Aufruf ein neues Array anzulegen
             try:
-                response = self.device.read(self.ep_in.bEndpointAddress, 
-                                           self.ep_in.wMaxPacketSize, 
-                                           timeout=timeout)
-                resp_str = ' '.join([f'{b:02x}' for b in response])
-                print(f"Antwort erhalten: {resp_str}")
+                nread = self.device.read(self._ep_in_addr,
+                                         self._resp_buf,
+                                         timeout=timeout)
+                response = self._resp_buf[:nread].tobytes()
+                if self._verbose:
+                    print(f"Antwort erhalten: {response.hex(' ')}")
                 return response
             except usb.core.USBError as e:
                 if e.errno == 110:  # Timeout
@@ -189,7 +375,187 @@ class PulsarMouse:
         except Exception as e:
             print(f"Fehler beim Senden des Befehls: {e}")
             return None
-    
+
+    def _send_command_libusb1(self, command, expect_response, timeout):
+        """
+        Sendet einen Befehl über den libusb1-Backend
+
+        Kopiert die Befehlsbytes in den vorallokierten Sendepuffer und
+        übergibt ein memoryview-Fenster, sodass pro Befehl keine neuen
+        Puffer entstehen
+
+        Args:
+            command: Zu sendende Befehlsbytes (bytes oder bytearray)
+            expect_response: Ob eine Antwort erwartet wird
+            timeout: Timeout in Millisekunden
+
+        Returns:
+            Die Antwort der Maus oder None
+        """
+        try:
+            # Eventuell noch ausstehenden Lese-Transfer zuerst abräumen
+            self.flush()
+
+            # Den Lese-Transfer bereits vor dem Schreiben einreihen, damit
+            # die URB schon wartet, wenn die Antwort eintrifft, statt erst
+            # nach Abschluss des Schreibvorgangs eingereicht zu werden
+            transfer = None
+            if expect_response:
+                transfer = self._handle.getTransfer()
+                transfer.setBulk(self._ep_in_addr, self._ep_in_maxpkt,
+                                 timeout=timeout)
+                transfer.submit()
+                self._pending_read = transfer
+
+            length = len(command)
+            self._tx_buf[:length] = command
+            bytes_sent = self._handle.bulkWrite(
+                self._ep_out_addr, memoryview(self._tx_buf)[:length], timeout)
+            if self._verbose:
+                cmd_str = bytes(command).hex(' ')
+                print(f"Befehl gesendet ({bytes_sent} Bytes): {cmd_str}")
+
+            if not expect_response:
+                return None
+
+            while transfer.isSubmitted():
+                self._ctx.handleEvents()
+            self._pending_read = None
+
+            status = transfer.getStatus()
+            if status == usb1.TRANSFER_COMPLETED:
+                response = bytes(transfer.getBuffer()[:transfer.getActualLength()])
+                if self._verbose:
+                    resp_str = bytes(response).hex(' ')
+                    print(f"Antwort erhalten: {resp_str}")
+                return response
+            if status == usb1.TRANSFER_TIMED_OUT:
+                print("Timeout beim Empfangen einer Antwort")
+            else:
+                print(f"Fehler beim Lesen der Antwort: Transfer-Status {status}")
+            return None
+
+        except Exception as e:
+            print(f"Fehler beim Senden des Befehls: {e}")
+            return None
+
+    def _raw_send(self, command: bytes, timeout: int = 300) -> Optional[int]:
+        """
+        Sendet einen Befehl ohne Antwort über den CFFI-Schnellpfad
+
+        Ruft libusb_bulk_transfer direkt mit vorallokierten Puffern auf
+        und umgeht so den PyUSB-Dispatcher; gedacht für Skripte, die
+        hunderte Setter-Befehle am Stück absetzen. Ohne cffi, libusb
+        oder erreichbares Gerätehandle fällt der Aufruf transparent auf
+        send_command zurück
+
+        Args:
+            command: Zu sendende Befehlsbytes
+            timeout: Timeout in Millisekunden
+
+        Returns:
+            int: Anzahl der übertragenen Bytes oder None bei Fehler
+        """
+        if self._fastpath is None:
+            self._fastpath = False
+            if not self.debug_mode and self.device is not None:
+                try:
+                    from . import _fastpath
+                    if _fastpath.available():
+                        import ctypes
+                        # Das libusb1-Backend von PyUSB hält den
+                        # libusb_device_handle im Ressourcen-Manager
+                        dev_handle = self.device._ctx.handle.handle
+                        ptr = ctypes.cast(dev_handle, ctypes.c_void_p).value
+                        if ptr:
+                            self._fastpath = _fastpath.FastPath(ptr)
+                except Exception:
+                    self._fastpath = False
+
+        if self._fastpath:
+            try:
+                return self._fastpath.bulk_write(self._ep_out_addr,
+                                                 bytes(command), timeout)
+            except OSError as e:
+                print(f"Fehler beim Senden des Befehls: {e}")
+                return None
+
+        self.send_command(command, expect_response=False, timeout=timeout)
+        return len(command)
+
+    def flush(self):
+        """
+        Wartet einen noch ausstehenden Lese-Transfer ab (libusb1-Backend)
+
+        Sollte vor dem Beenden aufgerufen werden, damit kein eingereihter
+        Transfer auf einen bereits geschlossenen Kontext zeigt
+        """
+        transfer = self._pending_read
+        if transfer is None:
+            return
+        try:
+            if transfer.isSubmitted():
+                transfer.cancel()
+                while transfer.isSubmitted():
+                    self._ctx.handleEvents()
+        except usb1.USBError:
+            pass
+        self._pending_read = None
+
+    @contextmanager
+    def batch(self):
+        """
+        Fasst mehrere Einstellungsänderungen zu einem Speichervorgang zusammen
+
+        Innerhalb des Blocks schicken die Setter ihre USB-Befehle sofort,
+        save_config (JSON-Serialisierung plus fsync) läuft aber erst beim
+        Verlassen des Blocks genau einmal
+
+        Beispiel:
+            with mouse.batch():
+                mouse.set_dpi(1600)
+                mouse.set_polling_rate(1000)
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                save_config(self.config)
+
+    def apply(self, dpi: int = None, stage: int = None, polling_rate: int = None,
+              liftoff_distance: float = None, motion_sync: bool = None,
+              buttons: Dict[int, str] = None, idle_time: int = None,
+              low_battery_threshold: int = None):
+        """
+        Wendet mehrere Einstellungen mit einem einzigen Speichervorgang an
+
+        Args:
+            dpi: DPI-Wert (50-32000 in 10er-Schritten)
+            stage: DPI-Stufe (1-6), wenn None, wird die aktive Stufe verwendet
+            polling_rate: Rate in Hz (125, 250, 500, 1000, 2000, 4000, 8000)
+            liftoff_distance: Distanz in mm (0.7, 1.0, 2.0)
+            motion_sync: Ob Motion Sync aktiviert werden soll
+            buttons: Zuordnung Tastennummer -> Aktionsname
+            idle_time: Zeit in Sekunden bis zum Ruhemodus
+            low_battery_threshold: Prozentwert für den Low-Power-Modus
+        """
+        with self.batch():
+            if dpi is not None:
+                self.set_dpi(dpi, stage)
+            if polling_rate is not None:
+                self.set_polling_rate(polling_rate)
+            if liftoff_distance is not None:
+                self.set_liftoff_distance(liftoff_distance)
+            if motion_sync is not None:
+                self.set_motion_sync(motion_sync)
+            if buttons:
+                for button, action_name in buttons.items():
+                    self.set_button_mapping(button, action_name)
+            if idle_time is not None:
+                self.set_power_saving(idle_time, low_battery_threshold)
+
     def get_device_info(self):
         """Ruft Informationen über die Maus ab"""
         print("\nRufe Geräteinformationen ab...")
@@ -225,9 +591,8 @@ class PulsarMouse:
             stage: DPI-Stufe (1-6), wenn None, wird die aktive Stufe verwendet
         """
         # Aktives Profil abrufen
-        active_profile = self.config["active_profile"]
-        profile_config = self.config["profiles"][active_profile]
-        
+        profile_config = self.active_profile_config
+
         # Wenn keine Stufe angegeben ist, die aktive Stufe verwenden
         if stage is None:
             stage = profile_config["active_dpi_stage"]
@@ -240,24 +605,92 @@ class PulsarMouse:
         # DPI-Wert auf gültigen Bereich beschränken und auf 10er-Schritte runden
         dpi = max(50, min(MAX_DPI, dpi))
         dpi = round(dpi / 10) * 10
-        
-        print(f"Setze DPI für Stufe {stage} auf {dpi}...")
+
+        # Unveränderte Werte weder an die Maus senden noch speichern
+        if profile_config["dpi_stages"].get(stage) == dpi:
+            if self._verbose:
+                print(f"DPI für Stufe {stage} ist bereits {dpi}.")
+            return
+
+        if self._verbose:
+            print(f"Setze DPI für Stufe {stage} auf {dpi}...")
         
         # Konfiguration aktualisieren
-        profile_config["dpi_stages"][str(stage)] = dpi
+        profile_config["dpi_stages"][stage] = dpi
         
         # Befehl zusammenstellen und senden
-        command = CMD_SET_DPI.copy()
+        command = bytearray(CMD_SET_DPI)
         command[1] = stage
         command[2] = (dpi >> 8) & 0xFF  # High-Byte
         command[3] = dpi & 0xFF         # Low-Byte
         
         self.send_command(command, expect_response=False)
-        print(f"DPI für Stufe {stage} auf {dpi} gesetzt.")
-        
-        # Konfiguration speichern
-        save_config(self.config)
-    
+        if self._verbose:
+            print(f"DPI für Stufe {stage} auf {dpi} gesetzt.")
+        
+        # Konfiguration speichern und memoisierte Profil-Sicht invalidieren;
+        # innerhalb von batch() wird das Speichern aufgeschoben
+        self._cfg_gen += 1
+        if self._batch_depth == 0:
+            save_config(self.config)
+
+    def set_dpi_stages(self, stages: Dict[int, int]):
+        """
+        Setzt mehrere DPI-Stufen mit einem einzigen Befehl
+
+        Packt alle sechs Stufen in ein Paket, statt pro Stufe einen
+        eigenen USB-Transfer samt Speichervorgang auszulösen
+
+        Args:
+            stages: Zuordnung von Stufe (1-6) zu DPI-Wert (50-32000)
+        """
+        profile_config = self.active_profile_config
+        dpi_stages = profile_config["dpi_stages"]
+
+        # Werte normalisieren und nur tatsächliche Änderungen übernehmen
+        changed = {}
+        for stage, dpi in stages.items():
+            if not 1 <= stage <= 6:
+                print(f"Warnung: Ungültige DPI-Stufe {stage} wird übersprungen.")
+                continue
+            dpi = max(50, min(MAX_DPI, dpi))
+            dpi = round(dpi / 10) * 10
+            if dpi_stages.get(stage) != dpi:
+                changed[stage] = dpi
+
+        # Unveränderte Werte weder an die Maus senden noch speichern
+        if not changed:
+            if self._verbose:
+                print("DPI-Stufen sind bereits aktuell.")
+            return
+
+        if self._verbose:
+            print(f"Setze {len(changed)} DPI-Stufen...")
+
+        # Konfiguration in einem Durchlauf aktualisieren
+        dpi_stages.update(changed)
+
+        # Befehl zusammenstellen und senden: je Stufe High- und Low-Byte;
+        # geladene Konfigurationen können weniger als sechs Stufen haben
+        # (siehe cycle_dpi_stage), nicht konfigurierte Stufen werden als 0 gesendet
+        command = bytearray(CMD_SET_DPI_BATCH)
+        for stage in range(1, 7):
+            dpi = dpi_stages.get(stage, 0)
+            offset = 1 + (stage - 1) * 2
+            command[offset] = (dpi >> 8) & 0xFF  # High-Byte
+            command[offset + 1] = dpi & 0xFF     # Low-Byte
+
+        self.send_command(command, expect_response=False)
+        if self._verbose:
+            for stage in sorted(changed):
+                print(f"DPI für Stufe {stage} auf {changed[stage]} gesetzt.")
+
+        # Konfiguration speichern und memoisierte Profil-Sicht invalidieren;
+        # innerhalb von batch() wird das Speichern aufgeschoben
+        self._cfg_gen += 1
+        if self._batch_depth == 0:
+            save_config(self.config)
+
     def set_polling_rate(self, rate: int):
         """
         Setzt die Polling-Rate
@@ -265,43 +698,52 @@ class PulsarMouse:
         Args:
             rate: Rate in Hz (125, 250, 500, 1000, 2000, 4000, 8000)
         """
-        # Gültigkeit der Rate prüfen
-        if rate not in POLLING_RATES:
-            closest_rate = min(POLLING_RATES, key=lambda x: abs(x - rate))
+        # Gültigkeit der Rate prüfen; bei ungültiger Rate den
+        # nächstgelegenen gültigen Wert per Binärsuche bestimmen
+        if POLLING_CODE.get(rate) is None:
+            pos = bisect_left(POLLING_RATES_SORTED, rate)
+            if pos == 0:
+                closest_rate = POLLING_RATES_SORTED[0]
+            elif pos == len(POLLING_RATES_SORTED):
+                closest_rate = POLLING_RATES_SORTED[-1]
+            else:
+                lower, upper = POLLING_RATES_SORTED[pos - 1], POLLING_RATES_SORTED[pos]
+                closest_rate = lower if rate - lower <= upper - rate else upper
             print(f"Warnung: Polling-Rate {rate}Hz nicht unterstützt. Verwende {closest_rate}Hz.")
             rate = closest_rate
-        
+
+        # Unveränderte Werte weder an die Maus senden noch speichern
+        if self.active_profile_config["polling_rate"] == rate:
+            if self._verbose:
+                print(f"Polling-Rate ist bereits {rate}Hz.")
+            return
+
         # Warnung anzeigen, wenn eine hohe Rate verwendet wird
         if rate > 1000:
             print(f"Hinweis: Polling-Raten über 1000Hz erfordern einen speziellen 8K-Dongle.")
-        
-        print(f"Setze Polling-Rate auf {rate}Hz...")
-        
+
+        if self._verbose:
+            print(f"Setze Polling-Rate auf {rate}Hz...")
+
         # Aktives Profil aktualisieren
-        active_profile = self.config["active_profile"]
-        self.config["profiles"][active_profile]["polling_rate"] = rate
+        self.active_profile_config["polling_rate"] = rate
         
         # Wert für das Protokoll ermitteln
-        rate_values = {
-            125: 0,
-            250: 1,
-            500: 2,
-            1000: 3,
-            2000: 4,
-            4000: 5,
-            8000: 6
-        }
-        rate_value = rate_values[rate]
+        rate_value = POLLING_CODE[rate]
         
         # Befehl zusammenstellen und senden
-        command = CMD_SET_POLLING.copy()
+        command = bytearray(CMD_SET_POLLING)
         command[1] = rate_value
         
         self.send_command(command, expect_response=False)
-        print(f"Polling-Rate auf {rate}Hz gesetzt.")
-        
-        # Konfiguration speichern
-        save_config(self.config)
+        if self._verbose:
+            print(f"Polling-Rate auf {rate}Hz gesetzt.")
+        
+        # Konfiguration speichern und memoisierte Profil-Sicht invalidieren;
+        # innerhalb von batch() wird das Speichern aufgeschoben
+        self._cfg_gen += 1
+        if self._batch_depth == 0:
+            save_config(self.config)
     
     def set_liftoff_distance(self, distance: float):
         """
@@ -310,31 +752,48 @@ class PulsarMouse:
         Args:
             distance: Distanz in mm (0.7, 1.0, 2.0)
         """
-        # Gültigkeit der Distanz prüfen
-        if distance not in LIFT_OFF_DISTANCE:
-            closest_dist = min(LIFT_OFF_DISTANCE, key=lambda x: abs(x - distance))
+        # Gültigkeit der Distanz prüfen; bei ungültiger Distanz den
+        # nächstgelegenen gültigen Wert per Binärsuche bestimmen
+        if LIFTOFF_CODE.get(distance) is None:
+            pos = bisect_left(LIFT_OFF_DISTANCE_SORTED, distance)
+            if pos == 0:
+                closest_dist = LIFT_OFF_DISTANCE_SORTED[0]
+            elif pos == len(LIFT_OFF_DISTANCE_SORTED):
+                closest_dist = LIFT_OFF_DISTANCE_SORTED[-1]
+            else:
+                lower, upper = LIFT_OFF_DISTANCE_SORTED[pos - 1], LIFT_OFF_DISTANCE_SORTED[pos]
+                closest_dist = lower if distance - lower <= upper - distance else upper
             print(f"Warnung: Lift-Off-Distanz {distance}mm nicht unterstützt. Verwende {closest_dist}mm.")
             distance = closest_dist
-        
-        print(f"Setze Lift-Off-Distanz auf {distance}mm...")
-        
+
+        # Unveränderte Werte weder an die Maus senden noch speichern
+        if self.active_profile_config["liftoff_distance"] == distance:
+            if self._verbose:
+                print(f"Lift-Off-Distanz ist bereits {distance}mm.")
+            return
+
+        if self._verbose:
+            print(f"Setze Lift-Off-Distanz auf {distance}mm...")
+
         # Aktives Profil aktualisieren
-        active_profile = self.config["active_profile"]
-        self.config["profiles"][active_profile]["liftoff_distance"] = distance
+        self.active_profile_config["liftoff_distance"] = distance
         
         # Wert für das Protokoll ermitteln
-        dist_values = {0.7: 0, 1.0: 1, 2.0: 2}
-        dist_value = dist_values[distance]
+        dist_value = LIFTOFF_CODE[distance]
         
         # Befehl zusammenstellen und senden
-        command = CMD_SET_LIFTOFF.copy()
+        command = bytearray(CMD_SET_LIFTOFF)
         command[1] = dist_value
         
         self.send_command(command, expect_response=False)
-        print(f"Lift-Off-Distanz auf {distance}mm gesetzt.")
-        
-        # Konfiguration speichern
-        save_config(self.config)
+        if self._verbose:
+            print(f"Lift-Off-Distanz auf {distance}mm gesetzt.")
+        
+        # Konfiguration speichern und memoisierte Profil-Sicht invalidieren;
+        # innerhalb von batch() wird das Speichern aufgeschoben
+        self._cfg_gen += 1
+        if self._batch_depth == 0:
+            save_config(self.config)
     
     def set_button_mapping(self, button: int, action_name: str):
         """
@@ -356,25 +815,37 @@ class PulsarMouse:
             return
         
         action_code = BUTTON_ACTIONS[action_name]
-        print(f"Setze Taste {button} auf '{action_name}' (Code: 0x{action_code:02x})...")
-        
+
+        # Unveränderte Belegungen weder an die Maus senden noch speichern
+        current = self.active_profile_config["buttons"].get(button)
+        if current is not None and current.get("code") == action_code:
+            if self._verbose:
+                print(f"Taste {button} ist bereits auf '{action_name}' gesetzt.")
+            return
+
+        if self._verbose:
+            print(f"Setze Taste {button} auf '{action_name}' (Code: 0x{action_code:02x})...")
+
         # Aktives Profil aktualisieren
-        active_profile = self.config["active_profile"]
-        self.config["profiles"][active_profile]["buttons"][str(button)] = {
+        self.active_profile_config["buttons"][button] = {
             "action": action_name,
             "code": action_code
         }
         
         # Befehl zusammenstellen und senden
-        command = CMD_SET_BUTTON.copy()
+        command = bytearray(CMD_SET_BUTTON)
         command[1] = button
         command[2] = action_code
         
         self.send_command(command, expect_response=False)
-        print(f"Taste {button} auf '{action_name}' gesetzt.")
-        
-        # Konfiguration speichern
-        save_config(self.config)
+        if self._verbose:
+            print(f"Taste {button} auf '{action_name}' gesetzt.")
+        
+        # Konfiguration speichern und memoisierte Profil-Sicht invalidieren;
+        # innerhalb von batch() wird das Speichern aufgeschoben
+        self._cfg_gen += 1
+        if self._batch_depth == 0:
+            save_config(self.config)
     
     def set_motion_sync(self, enabled: bool):
         """
@@ -384,21 +855,32 @@ class PulsarMouse:
             enabled: Ob Motion Sync aktiviert werden soll
         """
         status = "aktiviert" if enabled else "deaktiviert"
-        print(f"Motion Sync wird {status}...")
-        
+
+        # Unveränderte Werte weder an die Maus senden noch speichern
+        if self.active_profile_config["motion_sync"] == enabled:
+            if self._verbose:
+                print(f"Motion Sync ist bereits {status}.")
+            return
+
+        if self._verbose:
+            print(f"Motion Sync wird {status}...")
+
         # Aktives Profil aktualisieren
-        active_profile = self.config["active_profile"]
-        self.config["profiles"][active_profile]["motion_sync"] = enabled
+        self.active_profile_config["motion_sync"] = enabled
         
         # Befehl zusammenstellen und senden
-        command = CMD_SET_MOTION_SYNC.copy()
+        command = bytearray(CMD_SET_MOTION_SYNC)
         command[1] = 1 if enabled else 0
         
         self.send_command(command, expect_response=False)
-        print(f"Motion Sync {status}.")
-        
-        # Konfiguration speichern
-        save_config(self.config)
+        if self._verbose:
+            print(f"Motion Sync {status}.")
+        
+        # Konfiguration speichern und memoisierte Profil-Sicht invalidieren;
+        # innerhalb von batch() wird das Speichern aufgeschoben
+        self._cfg_gen += 1
+        if self._batch_depth == 0:
+            save_config(self.config)
     
     def set_power_saving(self, idle_time: int, low_battery_threshold: int = None):
         """
@@ -412,23 +894,31 @@ class PulsarMouse:
         if not 30 <= idle_time <= 900:
             print(f"Warnung: Ungültige Zeit {idle_time}s. Gültiger Bereich ist 30-900s.")
             idle_time = max(30, min(900, idle_time))
-        
-        print(f"Setze Energiesparoptionen...")
-        
+
+        # Gültigkeit des Schwellwerts prüfen
+        if low_battery_threshold is not None and not 5 <= low_battery_threshold <= 20:
+            print(f"Warnung: Ungültiger Batterieschwellwert {low_battery_threshold}%. Gültiger Bereich ist 5-20%.")
+            low_battery_threshold = max(5, min(20, low_battery_threshold))
+
+        # Unveränderte Werte weder an die Maus senden noch speichern
+        power_saving = self.active_profile_config["power_saving"]
+        if (power_saving["idle_time"] == idle_time
+                and (low_battery_threshold is None
+                     or power_saving["low_battery_threshold"] == low_battery_threshold)):
+            if self._verbose:
+                print("Energiesparoptionen sind unverändert.")
+            return
+
+        if self._verbose:
+            print(f"Setze Energiesparoptionen...")
+
         # Aktives Profil aktualisieren
-        active_profile = self.config["active_profile"]
-        self.config["profiles"][active_profile]["power_saving"]["idle_time"] = idle_time
-        
+        power_saving["idle_time"] = idle_time
         if low_battery_threshold is not None:
-            # Gültigkeit des Schwellwerts prüfen
-            if not 5 <= low_battery_threshold <= 20:
-                print(f"Warnung: Ungültiger Batterieschwellwert {low_battery_threshold}%. Gültiger Bereich ist 5-20%.")
-                low_battery_threshold = max(5, min(20, low_battery_threshold))
-            
-            self.config["profiles"][active_profile]["power_saving"]["low_battery_threshold"] = low_battery_threshold
-        
+            power_saving["low_battery_threshold"] = low_battery_threshold
+
         # Befehl zusammenstellen und senden
-        command = CMD_SET_POWER.copy()
+        command = bytearray(CMD_SET_POWER)
         command[1] = idle_time & 0xFF         # Low-Byte
         command[2] = (idle_time >> 8) & 0xFF  # High-Byte
         
@@ -436,13 +926,16 @@ class PulsarMouse:
             command[3] = low_battery_threshold
         
         self.send_command(command, expect_response=False)
-        print(f"Energiesparoptionen gesetzt: Idle-Zeit = {idle_time}s")
-        
-        if low_battery_threshold is not None:
-            print(f"Low-Battery-Schwellwert = {low_battery_threshold}%")
-        
-        # Konfiguration speichern
-        save_config(self.config)
+        if self._verbose:
+            print(f"Energiesparoptionen gesetzt: Idle-Zeit = {idle_time}s")
+            if low_battery_threshold is not None:
+                print(f"Low-Battery-Schwellwert = {low_battery_threshold}%")
+
+        # Konfiguration speichern und memoisierte Profil-Sicht invalidieren;
+        # innerhalb von batch() wird das Speichern aufgeschoben
+        self._cfg_gen += 1
+        if self._batch_depth == 0:
+            save_config(self.config)
     
     def save_to_profile(self, profile_num: int):
         """
@@ -455,21 +948,27 @@ class PulsarMouse:
             print(f"Warnung: Ungültige Profilnummer {profile_num}. Gültige Werte sind 1-4.")
             return
         
-        print(f"Speichere Einstellungen in Profil {profile_num}...")
+        if self._verbose:
+            print(f"Speichere Einstellungen in Profil {profile_num}...")
         
         # Befehl zusammenstellen und senden
-        command = CMD_SAVE_PROFILE.copy()
+        command = bytearray(CMD_SAVE_PROFILE)
         command[1] = profile_num
         
         self.send_command(command, expect_response=False)
-        print(f"Einstellungen in Profil {profile_num} gespeichert.")
+        if self._verbose:
+            print(f"Einstellungen in Profil {profile_num} gespeichert.")
         
         # Aktives Profil setzen
         self.config["active_profile"] = str(profile_num)
         
-        # Konfiguration speichern
-        save_config(self.config)
+        # Konfiguration speichern und memoisierte Profil-Sicht invalidieren;
+        # innerhalb von batch() wird das Speichern aufgeschoben
+        self._cfg_gen += 1
+        if self._batch_depth == 0:
+            save_config(self.config)
     
     def show_current_settings(self):
         """Zeigt die aktuellen Einstellungen an"""
+        from ..config.profiles import print_profile_settings
         print_profile_settings(self.config)